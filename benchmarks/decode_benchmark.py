@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Decode benchmark - Time per payload and retained memory for the service
+layer's JSON decoding (json vs orjson, full vs projected responses)
+"""
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import generate_text_search_payloads
+from src.infrastructure.services.response_decoder import (
+    KEEP,
+    PROJECTIONS,
+    compile_projection,
+    orjson,
+)
+
+
+def _decoders():
+    decoders = {"json": json.loads}
+    if orjson is not None:
+        decoders["orjson"] = orjson.loads
+    return decoders
+
+
+def _load_payloads(directory: str | None, count: int) -> dict[str, list[bytes]]:
+    """
+    Payloads per API name. Recorded runs file them under one subdirectory per
+    service (RECORD_RESPONSES_DIR/places_search/...); synthetic ones are
+    Text Search pages.
+    """
+    if not directory:
+        return {"places_search": list(generate_text_search_payloads(count))}
+
+    payloads = {}
+    for api in PROJECTIONS:
+        paths = sorted((Path(directory) / api).glob("*.json"))
+        if paths:
+            payloads[api] = [path.read_bytes() for path in paths]
+    if not payloads:
+        print(f"✗ No recorded payloads in {directory}/{{{','.join(PROJECTIONS)}}}/")
+        sys.exit(1)
+    return payloads
+
+
+def run(payloads, projection, repeat):
+    total_bytes = sum(len(p) for p in payloads)
+    results = []
+    for decoder_name, loads in _decoders().items():
+        for mode, spec in (("full", KEEP), ("projected", projection)):
+            project = compile_projection(spec)
+            start = time.perf_counter()
+            for _ in range(repeat):
+                for payload in payloads:
+                    project(loads(payload))
+            elapsed = time.perf_counter() - start
+
+            # Memory still held when every decoded response is kept around
+            tracemalloc.start()
+            kept = [project(loads(payload)) for payload in payloads]
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            del kept
+
+            calls = repeat * len(payloads)
+            results.append({
+                "decoder": decoder_name,
+                "mode": mode,
+                "us_per_payload": elapsed / calls * 1e6,
+                "mb_per_second": total_bytes * repeat / elapsed / 1e6,
+                "retained_kb_per_payload": retained / len(payloads) / 1024,
+            })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark JSON decoding and response projection",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Synthetic Text Search pages
+  python benchmarks/decode_benchmark.py
+
+  # Real payloads recorded from a collection run
+  RECORD_RESPONSES_DIR=data/payloads python src/main.py
+  python benchmarks/decode_benchmark.py --payloads data/payloads
+        """
+    )
+    parser.add_argument(
+        '--payloads',
+        help='RECORD_RESPONSES_DIR of a recorded run (default: synthetic Text Search pages)'
+    )
+    parser.add_argument(
+        '--count',
+        type=int,
+        default=200,
+        help='Number of synthetic payloads (default: 200)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='Passes over the payloads per measurement (default: 5)'
+    )
+
+    args = parser.parse_args()
+
+    payloads_by_api = _load_payloads(args.payloads, args.count)
+    if orjson is None:
+        print("  orjson not installed - only the json module is measured")
+
+    for api, payloads in payloads_by_api.items():
+        size_kb = sum(len(p) for p in payloads) / len(payloads) / 1024
+        print(f"\n[Decode] {api}: {len(payloads)} payloads, {size_kb:.1f} KB average")
+        results = run(payloads, PROJECTIONS[api], args.repeat)
+
+        print(f"{'decoder':<8} {'mode':<10} {'µs/payload':>12} {'MB/s':>8} {'retained KB':>12}")
+        for r in results:
+            print(
+                f"{r['decoder']:<8} {r['mode']:<10} {r['us_per_payload']:>12.1f} "
+                f"{r['mb_per_second']:>8.1f} {r['retained_kb_per_payload']:>12.1f}"
+            )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+Benchmark CLI - Throughput, peak RSS and wall time for the offline pipeline
+(CsvExporter, LeadClassifier, CsvMerger) on synthetic data
+"""
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import queue as queue_module
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import generate_leads, write_csv_files
+from src.application.lead_classifier import LeadClassifier
+from src.domain.lead_batch import LeadBatch
+from src.infrastructure.external.csv_exporter import CsvExporter
+from src.infrastructure.external.csv_merger import CsvMerger
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def _stage_generate(rows, options, workdir):
+    # Cost of the synthetic generator itself; every other stage builds its
+    # input before the timed region
+    for _ in generate_leads(rows, options["duplicate_ratio"]):
+        pass
+
+
+def _stage_export(rows, options, workdir):
+    leads = list(generate_leads(rows, options["duplicate_ratio"]))
+    start = time.perf_counter()
+    CsvExporter().export(workdir / "leads.csv", leads)
+    return start
+
+
+def _stage_export_gz(rows, options, workdir):
+    leads = list(generate_leads(rows, options["duplicate_ratio"]))
+    start = time.perf_counter()
+    CsvExporter().export(workdir / "leads.csv.gz", leads)
+    return start
+
+
+def _stage_classify(rows, options, workdir):
+    leads = list(generate_leads(rows, options["duplicate_ratio"]))
+    start = time.perf_counter()
+    LeadClassifier().split_by_website(leads)
+    return start
+
+
+def _stage_classify_batch(rows, options, workdir):
+    leads = LeadBatch.from_leads(generate_leads(rows, options["duplicate_ratio"]))
+    start = time.perf_counter()
+    LeadClassifier().split_by_website(leads)
+    return start
+
+
+def _stage_merge_files(rows, options, workdir):
+    input_files = sorted(Path(options["csv_dir"]).glob("*.csv"))
+    CsvMerger().merge_files(input_files, workdir / "merged.csv")
+
+
+def _stage_merge_by_pattern(rows, options, workdir):
+    CsvMerger().merge_by_pattern("lu*_hairdresser_*.csv", workdir / "merged.csv", options["csv_dir"])
+
+
+STAGES = {
+    "generate": _stage_generate,
+    "export": _stage_export,
+    "export_gz": _stage_export_gz,
+    "classify": _stage_classify,
+    "classify_batch": _stage_classify_batch,
+    "merge_files": _stage_merge_files,
+    "merge_by_pattern": _stage_merge_by_pattern,
+}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run_stage(stage, rows, options, queue):
+    """Run one stage in a fresh process so peak RSS belongs to that stage alone"""
+    with tempfile.TemporaryDirectory() as tmp, contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        # Stages with untimed setup return the time their measured work began
+        start = STAGES[stage](rows, options, Path(tmp)) or start
+        wall = time.perf_counter() - start
+    queue.put({
+        "rows": rows,
+        "wall_seconds": round(wall, 4),
+        "rows_per_sec": round(rows / wall, 1) if wall > 0 else None,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    })
+
+
+def _wait_for_result(process, queue, rows):
+    """
+    Wait for the stage's result, polling so a child that dies without
+    reporting (e.g. OOM-killed at 10M rows) is recorded as failed instead of
+    hanging the harness.
+    """
+    while True:
+        try:
+            return queue.get(timeout=1)
+        except queue_module.Empty:
+            if process.exitcode is None:
+                continue
+        # The child exited; pick up a result it may have queued just before
+        try:
+            return queue.get(timeout=1)
+        except queue_module.Empty:
+            return {
+                "rows": rows,
+                "failed": True,
+                "exitcode": process.exitcode,
+                "wall_seconds": None,
+                "rows_per_sec": None,
+                "peak_rss_mb": None,
+            }
+
+
+def run_benchmarks(stages, sizes, options):
+    ctx = multiprocessing.get_context("spawn")
+    results = {}
+
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as csv_dir:
+            if any(stage.startswith("merge") for stage in stages):
+                write_csv_files(
+                    csv_dir, rows,
+                    file_count=options["file_count"],
+                    duplicate_ratio=options["duplicate_ratio"],
+                )
+            stage_options = {**options, "csv_dir": csv_dir}
+
+            for stage in stages:
+                queue = ctx.Queue()
+                process = ctx.Process(target=_run_stage, args=(stage, rows, stage_options, queue))
+                process.start()
+                result = _wait_for_result(process, queue, rows)
+                process.join()
+
+                results[f"{stage}@{rows}"] = result
+                if result.get("failed"):
+                    print(f"  {stage:<18} {rows:>10,} rows  ✗ FAILED (exit code {result['exitcode']})")
+                    continue
+                print(
+                    f"  {stage:<18} {rows:>10,} rows  "
+                    f"{result['wall_seconds']:>9.3f}s  "
+                    f"{result['rows_per_sec'] or 0:>12,.0f} rows/s  "
+                    f"{result['peak_rss_mb']:>8.1f} MB"
+                )
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Print changes against baseline; return names of regressed benchmarks"""
+    regressions = []
+    print("\nComparison with baseline:")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if result.get("failed"):
+            regressions.append(name)
+            print(f"  {name:<30} ✗ FAILED (exit code {result['exitcode']})")
+            continue
+        if not base or not base.get("rows_per_sec") or not result["rows_per_sec"]:
+            print(f"  {name:<30} (no baseline)")
+            continue
+
+        speed = result["rows_per_sec"] / base["rows_per_sec"] - 1
+        memory = result["peak_rss_mb"] / base["peak_rss_mb"] - 1 if base["peak_rss_mb"] else 0
+        regressed = speed < -tolerance or memory > tolerance
+        if regressed:
+            regressions.append(name)
+        print(
+            f"  {name:<30} throughput {speed:+7.1%}  peak RSS {memory:+7.1%}"
+            f"{'  ✗ REGRESSION' if regressed else ''}"
+        )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the exporter, classifier and merger on synthetic leads",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Quick run at the default sizes
+  python benchmarks/run_benchmarks.py
+
+  # Record a baseline, then compare a later run against it
+  python benchmarks/run_benchmarks.py --rows 10000 100000 1000000 --save-baseline
+  python benchmarks/run_benchmarks.py --rows 10000 100000 1000000 --compare
+
+  # Only the merger, with heavy overlap across 50 files
+  python benchmarks/run_benchmarks.py --stages merge_files --file-count 50 --duplicate-ratio 0.5
+        """
+    )
+    parser.add_argument(
+        '--rows',
+        nargs='+',
+        type=int,
+        default=[10_000, 100_000],
+        help='Row counts to benchmark (default: 10000 100000; up to 10M)'
+    )
+    parser.add_argument(
+        '--stages',
+        nargs='+',
+        choices=list(STAGES),
+        default=list(STAGES),
+        help='Stages to run (default: all)'
+    )
+    parser.add_argument(
+        '--duplicate-ratio',
+        type=float,
+        default=0.2,
+        help='Fraction of rows reusing an earlier place_id (default: 0.2)'
+    )
+    parser.add_argument(
+        '--file-count',
+        type=int,
+        default=10,
+        help='Number of CSV files the merge stages read (default: 10)'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=str(DEFAULT_BASELINE),
+        help=f'Baseline JSON file (default: {DEFAULT_BASELINE.name})'
+    )
+    parser.add_argument(
+        '--save-baseline',
+        action='store_true',
+        help='Store this run as the new baseline'
+    )
+    parser.add_argument(
+        '--compare',
+        action='store_true',
+        help='Compare against the baseline and exit 1 on regression'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.2,
+        help='Allowed throughput drop / RSS growth before failing (default: 0.2)'
+    )
+    parser.add_argument(
+        '--output',
+        '-o',
+        help='Also write this run\'s results to a JSON file'
+    )
+
+    args = parser.parse_args()
+
+    options = {"duplicate_ratio": args.duplicate_ratio, "file_count": args.file_count}
+    print(f"[Benchmarks] stages={args.stages} rows={args.rows}")
+    results = run_benchmarks(args.stages, args.rows, options)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2))
+
+    baseline_path = Path(args.baseline)
+    if args.save_baseline:
+        baseline_path.write_text(json.dumps(results, indent=2))
+        print(f"\n✓ Baseline saved to {baseline_path}")
+
+    if args.compare:
+        if not baseline_path.exists():
+            print(f"\n✗ No baseline at {baseline_path}. Run with --save-baseline first.")
+            sys.exit(1)
+        regressions = compare(results, json.loads(baseline_path.read_text()), args.tolerance)
+        if regressions:
+            print(f"\n✗ {len(regressions)} benchmark(s) regressed beyond {args.tolerance:.0%}")
+            sys.exit(1)
+        print("\n✓ No regressions")
+
+    failed = [name for name, result in results.items() if result.get("failed")]
+    if failed:
+        print(f"\n✗ {len(failed)} stage(s) failed: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
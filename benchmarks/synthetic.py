@@ -0,0 +1,136 @@
+"""
+Synthetic BusinessLead, CSV and API payload generators for benchmarks
+"""
+import csv
+import json
+import random
+from pathlib import Path
+from typing import Iterator, List
+
+from src.domain.models import BusinessLead
+from src.infrastructure.external.csv_exporter import FIELDNAMES, lead_to_row
+
+TOWNS = ["Luton", "Dunstable", "Houghton Regis", "Harpenden", "Leighton Buzzard", "Hitchin"]
+STREETS = ["High Street", "Park Road", "Station Road", "Church Street", "Mill Lane", "London Road"]
+NAME_WORDS = ["Studio", "Salon", "Cuts", "Beauty", "Lash", "Style", "Hair", "Barbers", "Lounge"]
+KEYWORDS = ["hairdresser", "barber", "beautician", "eyelash extensions"]
+
+
+def _lead(rng: random.Random, place_number: int) -> BusinessLead:
+    town = rng.choice(TOWNS)
+    name = f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} {place_number}"
+    has_website = rng.random() < 0.6
+    has_reviews = rng.random() < 0.9
+    return BusinessLead(
+        name=name,
+        address=f"{rng.randint(1, 300)} {rng.choice(STREETS)}, {town} LU{rng.randint(1, 7)} "
+                f"{rng.randint(1, 9)}AB, UK",
+        phone=f"01582 {rng.randint(100000, 999999)}" if rng.random() < 0.85 else None,
+        website=f"https://www.{name.lower().replace(' ', '')}.co.uk/" if has_website else None,
+        google_maps_url=f"https://maps.google.com/?cid={rng.getrandbits(63)}",
+        rating=round(rng.uniform(3.0, 5.0), 1) if has_reviews else None,
+        user_ratings_total=rng.randint(1, 2000) if has_reviews else None,
+        place_id=f"ChIJ{place_number:023d}",
+        keywords=[rng.choice(KEYWORDS)],
+    )
+
+
+def generate_leads(
+    rows: int,
+    duplicate_ratio: float = 0.0,
+    seed: int = 42,
+) -> Iterator[BusinessLead]:
+    """
+    Yield rows synthetic leads. About duplicate_ratio of them reuse the
+    place_id of an earlier lead, as happens across overlapping categories.
+    """
+    rng = random.Random(seed)
+    unique = 0
+    for _ in range(rows):
+        if unique and rng.random() < duplicate_ratio:
+            yield _lead(rng, rng.randrange(unique))
+        else:
+            yield _lead(rng, unique)
+            unique += 1
+
+
+def write_csv_files(
+    directory: str | Path,
+    rows: int,
+    file_count: int = 10,
+    duplicate_ratio: float = 0.2,
+    prefix: str = "lu",
+    seed: int = 42,
+) -> List[Path]:
+    """
+    Spread rows synthetic leads over file_count CSV files named like real
+    exports (lu1_hairdresser_with_website.csv, ...) and return their paths.
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    paths = [
+        directory / f"{prefix}{i + 1}_hairdresser_{'with' if i % 2 else 'without'}_website.csv"
+        for i in range(file_count)
+    ]
+    files = [path.open("w", newline="", encoding="utf-8") for path in paths]
+    try:
+        writers = [csv.writer(f) for f in files]
+        for writer in writers:
+            writer.writerow(FIELDNAMES)
+        for i, lead in enumerate(generate_leads(rows, duplicate_ratio, seed)):
+            writers[i % file_count].writerow(lead_to_row(lead))
+    finally:
+        for f in files:
+            f.close()
+    return paths
+
+
+def _text_search_place(rng: random.Random, place_number: int) -> dict:
+    """One Text Search result with the fields Google returns by default"""
+    town = rng.choice(TOWNS)
+    lat, lng = 51.88 + rng.uniform(-0.1, 0.1), -0.42 + rng.uniform(-0.1, 0.1)
+    return {
+        "business_status": "OPERATIONAL",
+        "formatted_address": f"{rng.randint(1, 300)} {rng.choice(STREETS)}, {town} LU1 1AB, UK",
+        "geometry": {
+            "location": {"lat": lat, "lng": lng},
+            "viewport": {
+                "northeast": {"lat": lat + 0.001, "lng": lng + 0.001},
+                "southwest": {"lat": lat - 0.001, "lng": lng - 0.001},
+            },
+        },
+        "icon": "https://maps.gstatic.com/mapfiles/place_api/icons/v1/png_71/generic_business-71.png",
+        "icon_background_color": "#7B9EB0",
+        "icon_mask_base_uri": "https://maps.gstatic.com/mapfiles/place_api/icons/v2/generic_pinlet",
+        "name": f"{rng.choice(NAME_WORDS)} {rng.choice(NAME_WORDS)} {place_number}",
+        "opening_hours": {"open_now": rng.random() < 0.5},
+        "photos": [
+            {
+                "height": 3024,
+                "width": 4032,
+                "html_attributions": [
+                    f'<a href="https://maps.google.com/maps/contrib/{rng.getrandbits(63)}">A User</a>'
+                ],
+                "photo_reference": "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdef0123456789_-", k=400)),
+            }
+        ] if rng.random() < 0.8 else [],
+        "place_id": f"ChIJ{place_number:023d}",
+        "plus_code": {"compound_code": f"V{rng.randint(100, 999)}+XX {town}", "global_code": "9C3XV000+XX"},
+        "rating": round(rng.uniform(3.0, 5.0), 1),
+        "reference": f"ChIJ{place_number:023d}",
+        "types": ["hair_care", "point_of_interest", "establishment"],
+        "user_ratings_total": rng.randint(1, 2000),
+    }
+
+
+def generate_text_search_payloads(count: int, seed: int = 42) -> Iterator[bytes]:
+    """Yield count Text Search response bodies of 20 results each"""
+    rng = random.Random(seed)
+    for page in range(count):
+        yield json.dumps({
+            "html_attributions": [],
+            "next_page_token": "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789", k=300)),
+            "results": [_text_search_place(rng, page * 20 + i) for i in range(20)],
+            "status": "OK",
+        }).encode("utf-8")
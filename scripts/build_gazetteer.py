@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Gazetteer Builder CLI - Build the offline postcode index used by GeocodeService
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.infrastructure.services.gazetteer import PostcodeGazetteer
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a memory-mapped postcode -> lat/lng index from a postcode CSV",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  # Build from a full UK postcode list (postcode,latitude,longitude columns)
+  python scripts/build_gazetteer.py --csv data/ukpostcodes.csv --output data/gazetteer.idx
+
+  # Then enable it for lead collection
+  export GAZETTEER_PATH=data/gazetteer.idx
+        """
+    )
+    parser.add_argument(
+        '--csv',
+        required=True,
+        help='Postcode CSV with postcode/latitude/longitude columns'
+    )
+    parser.add_argument(
+        '--output',
+        '-o',
+        required=True,
+        help='Output path for the index file'
+    )
+    parser.add_argument(
+        '--no-districts',
+        action='store_true',
+        help='Do not add district centroids (e.g. "LU1") averaged from full postcodes'
+    )
+    parser.add_argument(
+        '--lookup',
+        nargs='+',
+        help='Area names to look up in the built index as a sanity check'
+    )
+
+    args = parser.parse_args()
+
+    try:
+        count = PostcodeGazetteer.build(args.csv, args.output, districts=not args.no_districts)
+    except Exception as e:
+        print(f"\n✗ Error building gazetteer: {e}")
+        sys.exit(1)
+
+    if count == 0:
+        print("\n✗ No postcodes with coordinates were found.")
+        sys.exit(1)
+
+    if args.lookup:
+        gazetteer = PostcodeGazetteer(args.output)
+        for area in args.lookup:
+            print(f"  {area}: {gazetteer.lookup(area)}")
+        gazetteer.close()
+
+    print("\n✓ Gazetteer built successfully!")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,32 @@
-from typing import List, Tuple
+from typing import List, Tuple, overload
 
+from src.domain.lead_batch import LeadBatch
 from src.domain.models import BusinessLead
 from src.domain.lead_rules import has_website
 
 
 class LeadClassifier:
+    @overload
+    def split_by_website(
+        self, leads: LeadBatch
+    ) -> Tuple[LeadBatch, LeadBatch]: ...
+
+    @overload
     def split_by_website(
         self, leads: List[BusinessLead]
-    ) -> Tuple[List[BusinessLead], List[BusinessLead]]:
+    ) -> Tuple[List[BusinessLead], List[BusinessLead]]: ...
+
+    def split_by_website(self, leads):
         """
         Returns (with_website, without_website)
+        A LeadBatch is split into two LeadBatches without building lead objects.
         """
+        if isinstance(leads, LeadBatch):
+            with_website, without_website = [], []
+            for index, has in enumerate(leads.website.truthy_flags()):
+                (with_website if has else without_website).append(index)
+            return leads.take(with_website), leads.take(without_website)
+
         with_website = [lead for lead in leads if has_website(lead)]
         without_website = [lead for lead in leads if not has_website(lead)]
         return with_website, without_website
-
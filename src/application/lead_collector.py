@@ -1,11 +1,28 @@
-from typing import List, Optional
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
 
+from src.application.lead_prioritizer import CollectionBudget, LeadPrioritizer
 from src.domain.models import BusinessLead
+from src.infrastructure.services.gazetteer import PostcodeGazetteer
 from src.infrastructure.services.geocode import GeocodeService
 from src.infrastructure.services.places_search import PlacesSearchService
 from src.infrastructure.services.place_details_service import PlaceDetailsService
 from src.infrastructure.config.settings import settings
-from src.infrastructure.monitoring import RateLimiter, RateLimitConfig, APICostTracker
+from src.infrastructure.monitoring import (
+    RateLimiter,
+    RateLimitConfig,
+    APICostTracker,
+    ApiKeyPool,
+    ApiKeyPoolConfig,
+    HedgingPolicy,
+    HedgingConfig,
+    HedgeExecutor,
+    tracer,
+)
+
+# Upper bound on concurrent text searches in iter_leads_for_keywords
+MAX_CONCURRENT_SEARCHES = 8
 
 
 class LeadCollector:
@@ -18,83 +35,320 @@ class LeadCollector:
         # Initialize rate limiter and cost tracker if enabled
         self.rate_limiter = None
         self.cost_tracker = None
-        
-        if settings.enable_rate_limiting:
-            rate_config = RateLimitConfig(
-                requests_per_minute=settings.rate_limit_requests_per_minute,
-                requests_per_day=settings.rate_limit_requests_per_day,
+        self.key_pool = None
+
+        rate_config = RateLimitConfig(
+            requests_per_minute=settings.rate_limit_requests_per_minute,
+            requests_per_day=settings.rate_limit_requests_per_day,
+        )
+
+        if len(settings.google_maps_api_keys) > 1:
+            # Each pooled key gets its own rate limiter, so no shared limiter
+            # caps the pool at a single key's quota
+            self.key_pool = ApiKeyPool(
+                settings.google_maps_api_keys,
+                ApiKeyPoolConfig(
+                    cooldown_seconds=settings.key_cooldown_seconds,
+                    rate_limit=rate_config,
+                ),
             )
+        elif settings.enable_rate_limiting:
             self.rate_limiter = RateLimiter(rate_config)
         
         if settings.enable_cost_tracking:
             self.cost_tracker = APICostTracker()
+
+        # Shared by all services: room for every concurrent search plus a hedge each
+        self.hedge_executor = None
+        if settings.enable_hedging:
+            self.hedge_executor = HedgeExecutor(max_workers=2 * MAX_CONCURRENT_SEARCHES)
+
+        def hedging_policy() -> Optional[HedgingPolicy]:
+            # One policy per service: each API has its own latency profile
+            if not self.hedge_executor:
+                return None
+            return HedgingPolicy(
+                HedgingConfig(
+                    percentile=settings.hedge_percentile,
+                    max_hedge_ratio=settings.hedge_max_ratio,
+                ),
+                executor=self.hedge_executor,
+            )
+
+        # Opened only for our own GeocodeService; closed in close()
+        self.gazetteer = None
+        if settings.gazetteer_path and geocode_service is None:
+            self.gazetteer = PostcodeGazetteer(settings.gazetteer_path)
         
-        # Initialize services with rate limiter and cost tracker
+        # Initialize services with rate limiter, cost tracker and key pool
         self.geocode_service = geocode_service or GeocodeService(
             rate_limiter=self.rate_limiter,
             cost_tracker=self.cost_tracker,
+            key_pool=self.key_pool,
+            hedging=hedging_policy(),
+            gazetteer=self.gazetteer,
         )
         self.places_search_service = places_search_service or PlacesSearchService(
             rate_limiter=self.rate_limiter,
             cost_tracker=self.cost_tracker,
+            key_pool=self.key_pool,
+            hedging=hedging_policy(),
         )
         self.place_details_service = place_details_service or PlaceDetailsService(
             rate_limiter=self.rate_limiter,
             cost_tracker=self.cost_tracker,
+            key_pool=self.key_pool,
+            hedging=hedging_policy(),
         )
 
+    def close(self) -> None:
+        """Release the hedge worker threads and the gazetteer; call when done collecting"""
+        if self.hedge_executor:
+            self.hedge_executor.shutdown()
+        if self.gazetteer:
+            self.gazetteer.close()
+            self.gazetteer = None
+
+    def __enter__(self) -> "LeadCollector":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def collect_leads(
         self,
         area_name: str,
         keyword: str,
         radius: Optional[int] = None,
         max_results: Optional[int] = None,
+        prioritize: Optional[str] = None,
+        budget: Optional[CollectionBudget] = None,
     ) -> List[BusinessLead]:
-        radius = radius or settings.default_radius
-        max_results = max_results or settings.default_max_results
+        """
+        Collect leads for keyword around area_name into a list.
+        Takes the same arguments as iter_leads.
+        """
+        return list(
+            self.iter_leads(
+                area_name=area_name,
+                keyword=keyword,
+                radius=radius,
+                max_results=max_results,
+                prioritize=prioritize,
+                budget=budget,
+            )
+        )
 
-        lat, lng = self.geocode_service.geocode_area(area_name)
+    def iter_leads(
+        self,
+        area_name: str,
+        keyword: str,
+        radius: Optional[int] = None,
+        max_results: Optional[int] = None,
+        prioritize: Optional[str] = None,
+        budget: Optional[CollectionBudget] = None,
+    ) -> Iterator[BusinessLead]:
+        """
+        Yield leads for keyword around area_name as soon as their details arrive.
 
-        raw_places = self.places_search_service.search_places(
-            lat=lat,
-            lng=lng,
-            keyword=keyword,
+        prioritize: optional LeadPrioritizer strategy ("reviews", "rating",
+            "no_website"); details are then fetched highest-value first.
+        budget: optional CollectionBudget; its clock covers the whole run while
+            call and cost limits apply to Place Details requests. Collection
+            stops cleanly when it runs out, after the leads gathered so far.
+        """
+        return self.iter_leads_for_keywords(
+            area_name=area_name,
+            keywords=[keyword],
             radius=radius,
             max_results=max_results,
+            prioritize=prioritize,
+            budget=budget,
         )
 
-        leads: List[BusinessLead] = []
+    def collect_leads_for_keywords(
+        self,
+        area_name: str,
+        keywords: List[str],
+        radius: Optional[int] = None,
+        max_results: Optional[int] = None,
+        prioritize: Optional[str] = None,
+        budget: Optional[CollectionBudget] = None,
+    ) -> List[BusinessLead]:
+        """
+        Collect leads for several keywords around one area into a list.
+        Takes the same arguments as iter_leads_for_keywords.
+        """
+        return list(
+            self.iter_leads_for_keywords(
+                area_name=area_name,
+                keywords=keywords,
+                radius=radius,
+                max_results=max_results,
+                prioritize=prioritize,
+                budget=budget,
+            )
+        )
+
+    def iter_leads_for_keywords(
+        self,
+        area_name: str,
+        keywords: List[str],
+        radius: Optional[int] = None,
+        max_results: Optional[int] = None,
+        prioritize: Optional[str] = None,
+        budget: Optional[CollectionBudget] = None,
+    ) -> Iterator[BusinessLead]:
+        """
+        Yield leads for several keywords (e.g. "hairdresser", "barber") around
+        one area.
+
+        The area is geocoded once and the text searches run concurrently.
+        Places found by more than one keyword are deduplicated by place_id
+        before any details call, and each lead's keywords lists every keyword
+        that found it. max_results applies per keyword; prioritize and budget
+        behave as in iter_leads.
+
+        Raises ValueError if no non-blank keyword is given.
+        """
+        keywords = list(dict.fromkeys(k.strip() for k in keywords if k and k.strip()))
+        if not keywords:
+            raise ValueError("at least one keyword is required")
+
+        radius = radius or settings.default_radius
+        max_results = max_results or settings.default_max_results
+
+        if budget:
+            budget.start()
+
+        with tracer.span("LeadCollector.geocode", area=area_name):
+            lat, lng = self.geocode_service.geocode_area(area_name)
+
+        def search(keyword: str) -> List[Dict[str, Any]]:
+            with tracer.span("LeadCollector.search", keyword=keyword):
+                return self.places_search_service.search_places(
+                    lat=lat,
+                    lng=lng,
+                    keyword=keyword,
+                    radius=radius,
+                    max_results=max_results,
+                )
+
+        if len(keywords) == 1:
+            results_per_keyword = [search(keywords[0])]
+        else:
+            workers = min(len(keywords), MAX_CONCURRENT_SEARCHES)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results_per_keyword = list(executor.map(tracer.profiled(search), keywords))
+
+        # Union the hits, keeping the first search result seen for each place
+        places: Dict[str, Dict[str, Any]] = {}
+        keywords_by_place: Dict[str, List[str]] = {}
+        total_hits = 0
+        for keyword, results in zip(keywords, results_per_keyword):
+            for place in results:
+                place_id = place.get("place_id")
+                if not place_id:
+                    continue
+                total_hits += 1
+                places.setdefault(place_id, place)
+                matched = keywords_by_place.setdefault(place_id, [])
+                if keyword not in matched:
+                    matched.append(keyword)
+
+        if len(keywords) > 1:
+            print(
+                f"[LeadCollector] {len(keywords)} searches returned {total_hits} places, "
+                f"{len(places)} unique ({total_hits - len(places)} details calls saved)"
+            )
+
+        raw_places = list(places.values())
+        if prioritize:
+            raw_places = LeadPrioritizer(prioritize).order(raw_places)
+
+        yielded = 0
+        # Hedged details calls are billed too; count them against the budget
+        details_hedging = getattr(self.place_details_service, "hedging", None)
 
         for place in raw_places:
-            place_id = place.get("place_id")
-            if not place_id:
-                continue
+            place_id = place["place_id"]
 
-            details = self.place_details_service.get_place_details(place_id)
+            if budget:
+                if budget.exhausted():
+                    print(
+                        f"[LeadCollector] Budget reached after {budget.details_calls} "
+                        f"details calls (${budget.spent_usd:.4f}). "
+                        f"Returning {yielded} leads."
+                    )
+                    return
+                budget.record_details_call()
+
+            hedges_before = details_hedging.hedges if details_hedging else 0
+            with tracer.span("LeadCollector.details", place_id=place_id):
+                details = self.place_details_service.get_place_details(place_id)
+            if budget and details_hedging:
+                budget.record_hedged_details_calls(details_hedging.hedges - hedges_before)
             if not details:
                 continue
 
-            lead = BusinessLead(
-                name=details.get("name", ""),
-                address=details.get("formatted_address", ""),
-                phone=details.get("formatted_phone_number"),
-                website=details.get("website"),
-                google_maps_url=details.get("url"),
-                rating=details.get("rating"),
-                user_ratings_total=details.get("user_ratings_total"),
-                place_id=place_id,
-            )
-            leads.append(lead)
+            yielded += 1
+            yield self._build_lead(place_id, details, keywords_by_place[place_id])
 
-        return leads
+    async def aiter_leads(
+        self,
+        area_name: str,
+        keyword: str,
+        radius: Optional[int] = None,
+        max_results: Optional[int] = None,
+        prioritize: Optional[str] = None,
+        budget: Optional[CollectionBudget] = None,
+    ) -> AsyncIterator[BusinessLead]:
+        """
+        Async variant of iter_leads. The blocking API calls run in a worker
+        thread so the event loop stays free while each lead is fetched.
+        """
+        leads = self.iter_leads(
+            area_name=area_name,
+            keyword=keyword,
+            radius=radius,
+            max_results=max_results,
+            prioritize=prioritize,
+            budget=budget,
+        )
+        while True:
+            lead = await asyncio.to_thread(tracer.profiled(next), leads, None)
+            if lead is None:
+                return
+            yield lead
+
+    @staticmethod
+    def _build_lead(
+        place_id: str, details: Dict[str, Any], keywords: List[str]
+    ) -> BusinessLead:
+        return BusinessLead(
+            name=details.get("name", ""),
+            address=details.get("formatted_address", ""),
+            phone=details.get("formatted_phone_number"),
+            website=details.get("website"),
+            google_maps_url=details.get("url"),
+            rating=details.get("rating"),
+            user_ratings_total=details.get("user_ratings_total"),
+            place_id=place_id,
+            keywords=list(keywords),
+        )
     
     def get_cost_summary(self):
-        """Get the cost tracking summary"""
+        """Get the cost tracking summary, with per-key usage when a key pool is used"""
         if self.cost_tracker:
-            return self.cost_tracker.get_summary()
+            summary = self.cost_tracker.get_summary()
+            if self.key_pool:
+                summary["keys"] = self.key_pool.get_summary()
+            return summary
         return None
     
     def print_cost_summary(self):
         """Print the cost tracking summary"""
         if self.cost_tracker:
             self.cost_tracker.print_summary()
+            if self.key_pool:
+                self.key_pool.print_summary()
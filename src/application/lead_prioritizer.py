@@ -0,0 +1,101 @@
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from src.infrastructure.monitoring import APICostConfig
+
+
+@dataclass
+class CollectionBudget:
+    """
+    Limits for the Place Details stage of a collection run.
+    Any limit left as None is not enforced.
+
+    Hedged details calls (ENABLE_HEDGING) are billed and count towards
+    max_cost_usd. Since a hedge is decided mid-request, the last call can
+    overshoot max_cost_usd by at most one hedge.
+    """
+    max_details_calls: Optional[int] = None
+    max_cost_usd: Optional[float] = None
+    max_seconds: Optional[float] = None
+    cost_config: APICostConfig = field(default_factory=APICostConfig)
+    details_calls: int = field(default=0, init=False)
+    hedged_details_calls: int = field(default=0, init=False)
+    started_at: float = field(default_factory=time.monotonic, init=False)
+
+    def start(self) -> None:
+        """Reset counters and start the clock"""
+        self.details_calls = 0
+        self.hedged_details_calls = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def spent_usd(self) -> float:
+        calls = self.details_calls + self.hedged_details_calls
+        return calls * self.cost_config.place_details_per_1000 / 1000
+
+    def record_details_call(self) -> None:
+        self.details_calls += 1
+
+    def record_hedged_details_calls(self, count: int) -> None:
+        self.hedged_details_calls += count
+
+    def exhausted(self) -> bool:
+        """True if one more details call would break a limit"""
+        if self.max_details_calls is not None and self.details_calls >= self.max_details_calls:
+            return True
+        if self.max_cost_usd is not None:
+            next_call_cost = self.cost_config.place_details_per_1000 / 1000
+            if self.spent_usd + next_call_cost > self.max_cost_usd:
+                return True
+        if self.max_seconds is not None:
+            if time.monotonic() - self.started_at >= self.max_seconds:
+                return True
+        return False
+
+
+class LeadPrioritizer:
+    """
+    Orders text search hits so the most valuable places get their details
+    fetched first. Scores only use fields already present in search results.
+
+    Strategies:
+        reviews:    most reviewed first
+        rating:     highest rating, damped for places with few reviews
+        no_website: places that look like small businesses without a website
+    """
+
+    STRATEGIES = ("reviews", "rating", "no_website")
+
+    def __init__(self, strategy: str = "reviews") -> None:
+        if strategy not in self.STRATEGIES:
+            raise ValueError(
+                f"Unknown prioritization strategy '{strategy}'. "
+                f"Choose one of: {', '.join(self.STRATEGIES)}"
+            )
+        self.strategy = strategy
+
+    def score(self, place: Dict[str, Any]) -> float:
+        reviews = place.get("user_ratings_total") or 0
+        rating = place.get("rating") or 0.0
+
+        if self.strategy == "reviews":
+            return float(reviews)
+
+        if self.strategy == "rating":
+            # Pull ratings backed by only a handful of reviews towards zero
+            return rating * reviews / (reviews + 10)
+
+        # no_website: few reviews and no photos suggest a small independent
+        # business, which is far more likely to lack a website
+        score = 1 / (1 + math.log1p(reviews))
+        if not place.get("photos"):
+            score += 0.5
+        if place.get("business_status", "OPERATIONAL") != "OPERATIONAL":
+            score = 0.0
+        return score
+
+    def order(self, places: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Return places sorted highest score first (stable for equal scores)"""
+        return sorted(places, key=self.score, reverse=True)
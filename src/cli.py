@@ -1,18 +1,63 @@
+from datetime import datetime
+
 from src.application.lead_collector import LeadCollector
 from src.application.lead_classifier import LeadClassifier
-from src.infrastructure.external.csv_exporter import CsvExporter
+from src.infrastructure.config.settings import settings
+from src.infrastructure.external.exporters import get_exporter
+from src.infrastructure.monitoring import tracer
+
+
+def run_cli(trace_file: str | None = None, profile_file: str | None = None):
+    """
+    Interactive lead collection.
+
+    trace_file / profile_file: enable stage tracing and cProfile for this run.
+    Pass "auto" to write to output/traces/run_<timestamp>.json / .prof.
+    """
+    run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if trace_file == "auto":
+        trace_file = f"output/traces/run_{run_id}.json"
+    if profile_file == "auto":
+        profile_file = f"output/traces/run_{run_id}.prof"
+    if trace_file or profile_file:
+        tracer.enable(profile=bool(profile_file))
+
+    try:
+        _collect_and_export()
+    finally:
+        if tracer.enabled:
+            tracer.disable()
+            tracer.print_summary()
+            if trace_file:
+                tracer.write(trace_file)
+            if profile_file:
+                tracer.dump_profile(profile_file)
 
 
-def run_cli():
+def _collect_and_export():
     area = input("Area (e.g. 'Luton, UK'): ").strip()
-    keyword = input("Keyword (e.g. 'eyelash extensions'): ").strip()
+    keywords = []
+    while not keywords:
+        keyword = input("Keyword(s), comma-separated (e.g. 'hairdresser, barber'): ").strip()
+        keywords = [k.strip() for k in keyword.split(",") if k.strip()]
+        if not keywords:
+            print("[WARN] Enter at least one keyword.")
+
+    safe_keyword = "+".join(k.replace(" ", "_").lower() for k in keywords)
+    safe_area = area.replace(" ", "_").lower()
+
+    # Resolve exporters before collecting, so a bad EXPORT_FORMAT or a missing
+    # compression library fails before any API spend
+    extension = settings.export_format.lstrip(".")
+    with_web_file = f"output/{safe_area}_{safe_keyword}_with_website.{extension}"
+    without_web_file = f"output/{safe_area}_{safe_keyword}_without_website.{extension}"
+    exporter = get_exporter(with_web_file)
 
-    collector = LeadCollector()
     classifier = LeadClassifier()
-    exporter = CsvExporter()
 
-    print(f"\n[INFO] Collecting leads for area='{area}', keyword='{keyword}'...")
-    leads = collector.collect_leads(area_name=area, keyword=keyword)
+    print(f"\n[INFO] Collecting leads for area='{area}', keywords={keywords}...")
+    with LeadCollector() as collector:
+        leads = collector.collect_leads_for_keywords(area_name=area, keywords=keywords)
 
     with_web, without_web = classifier.split_by_website(leads)
 
@@ -20,11 +65,8 @@ def run_cli():
     print(f"[INFO] With website: {len(with_web)}")
     print(f"[INFO] Without website: {len(without_web)}")
 
-    safe_keyword = keyword.replace(" ", "_").lower()
-    safe_area = area.replace(" ", "_").lower()
-
-    exporter.export(f"output/{safe_area}_{safe_keyword}_with_website.csv", with_web)
-    exporter.export(f"output/{safe_area}_{safe_keyword}_without_website.csv", without_web)
+    exporter.export(with_web_file, with_web)
+    exporter.export(without_web_file, without_web)
     print("\n[INFO] Lead collection and export completed.")
     
     # Print cost summary if tracking is enabled
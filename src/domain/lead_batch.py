@@ -0,0 +1,205 @@
+import math
+from array import array
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional
+
+from .models import BusinessLead, CompactLead
+
+
+class DictionaryColumn:
+    """
+    Dictionary-encoded column: each distinct value is stored once and rows
+    hold a 4-byte code. Code 0 is reserved for None.
+    """
+
+    def __init__(self) -> None:
+        self.values: List[Optional[Hashable]] = [None]
+        self._codes_by_value: Dict[Hashable, int] = {None: 0}
+        self.codes = array("I")
+
+    def encode(self, value: Optional[Hashable]) -> int:
+        code = self._codes_by_value.get(value)
+        if code is None:
+            code = len(self.values)
+            self._codes_by_value[value] = code
+            self.values.append(value)
+        return code
+
+    def append(self, value: Optional[Hashable]) -> None:
+        self.codes.append(self.encode(value))
+
+    def __getitem__(self, index: int) -> Optional[Hashable]:
+        return self.values[self.codes[index]]
+
+    def take(self, indices: List[int]) -> "DictionaryColumn":
+        """New column with the given rows; the dictionary is shared, not copied"""
+        column = DictionaryColumn.__new__(DictionaryColumn)
+        column.values = self.values
+        column._codes_by_value = self._codes_by_value
+        column.codes = array("I", (self.codes[i] for i in indices))
+        return column
+
+
+class SplitStringColumn:
+    """
+    String column for values sharing a common prefix or suffix, such as URL
+    prefixes ("https://maps.google.com/?cid=") or the town/postcode tail of
+    an address. The shared part is dictionary-encoded; the rest is kept as is.
+    """
+
+    def __init__(self, split: Callable[[str], int], shared_prefix: bool = True) -> None:
+        self.split = split
+        self.shared_prefix = shared_prefix
+        self.shared = DictionaryColumn()
+        self.rest: List[Optional[str]] = []
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.shared.append(None)
+            self.rest.append(None)
+            return
+        i = self.split(value)
+        if self.shared_prefix:
+            self.shared.append(value[:i])
+            self.rest.append(value[i:])
+        else:
+            self.shared.append(value[i:])
+            self.rest.append(value[:i])
+
+    def __getitem__(self, index: int) -> Optional[str]:
+        rest = self.rest[index]
+        if rest is None:
+            return None
+        shared = self.shared[index]
+        return shared + rest if self.shared_prefix else rest + shared
+
+    def truthy_flags(self) -> List[bool]:
+        """bool(value) for every row, without rebuilding the strings"""
+        shared_truthy = [bool(value) for value in self.shared.values]
+        return [
+            bool(rest) or shared_truthy[code]
+            for rest, code in zip(self.rest, self.shared.codes)
+        ]
+
+    def take(self, indices: List[int]) -> "SplitStringColumn":
+        column = SplitStringColumn(self.split, self.shared_prefix)
+        column.shared = self.shared.take(indices)
+        column.rest = [self.rest[i] for i in indices]
+        return column
+
+
+def _after_last_separator(value: str) -> int:
+    """https://maps.google.com/?cid=123 -> split before "123" """
+    return max(value.rfind("/"), value.rfind("=")) + 1
+
+
+def _after_scheme(value: str) -> int:
+    """https://www.example.co.uk/ -> split after "https://www." """
+    start = value.find("://")
+    start = start + 3 if start != -1 else 0
+    if value.startswith("www.", start):
+        start += 4
+    return start
+
+
+def _first_space(value: str) -> int:
+    """01582 123456 -> split after "01582 " """
+    return value.find(" ") + 1
+
+
+def _first_comma(value: str) -> int:
+    """12 High Street, Luton LU1 3AB, UK -> shared tail ", Luton LU1 3AB, UK" """
+    i = value.find(",")
+    return i if i != -1 else len(value)
+
+
+class LeadBatch:
+    """
+    Columnar container for many leads.
+
+    Repeated strings (URL prefixes, phone area codes, the town/postcode part
+    of addresses, keyword sets) are stored once; rating and review counts sit
+    in typed arrays. Rows come back as CompactLead, and conversion to and
+    from lists of BusinessLead is a single pass.
+    """
+
+    def __init__(self) -> None:
+        self.name: List[str] = []
+        self.address = SplitStringColumn(_first_comma, shared_prefix=False)
+        self.phone = SplitStringColumn(_first_space)
+        self.website = SplitStringColumn(_after_scheme)
+        self.google_maps_url = SplitStringColumn(_after_last_separator)
+        self.rating = array("d")  # NaN = no rating
+        # 1 where the rating was an int (Google sends "rating": 5 for perfect
+        # scores), so rows export exactly as the BusinessLead they came from
+        self.rating_is_int = array("B")
+        self.user_ratings_total = array("q")  # -1 = no reviews count
+        self.place_id: List[Optional[str]] = []
+        self.keywords = DictionaryColumn()
+
+    @classmethod
+    def from_leads(cls, leads: Iterable[BusinessLead | CompactLead]) -> "LeadBatch":
+        batch = cls()
+        batch.extend(leads)
+        return batch
+
+    def append(self, lead: BusinessLead | CompactLead) -> None:
+        self.name.append(lead.name)
+        self.address.append(lead.address)
+        self.phone.append(lead.phone)
+        self.website.append(lead.website)
+        self.google_maps_url.append(lead.google_maps_url)
+        self.rating.append(lead.rating if lead.rating is not None else math.nan)
+        self.rating_is_int.append(isinstance(lead.rating, int))
+        self.user_ratings_total.append(
+            lead.user_ratings_total if lead.user_ratings_total is not None else -1
+        )
+        self.place_id.append(lead.place_id)
+        self.keywords.append(tuple(lead.keywords))
+
+    def extend(self, leads: Iterable[BusinessLead | CompactLead]) -> None:
+        for lead in leads:
+            self.append(lead)
+
+    def __len__(self) -> int:
+        return len(self.name)
+
+    def __getitem__(self, index: int) -> CompactLead:
+        rating = self.rating[index]
+        if math.isnan(rating):
+            rating = None
+        elif self.rating_is_int[index]:
+            rating = int(rating)
+        user_ratings_total = self.user_ratings_total[index]
+        return CompactLead(
+            name=self.name[index],
+            address=self.address[index],
+            phone=self.phone[index],
+            website=self.website[index],
+            google_maps_url=self.google_maps_url[index],
+            rating=rating,
+            user_ratings_total=None if user_ratings_total < 0 else user_ratings_total,
+            place_id=self.place_id[index],
+            keywords=self.keywords[index] or (),
+        )
+
+    def __iter__(self) -> Iterator[CompactLead]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def to_leads(self) -> List[BusinessLead]:
+        return [lead.to_lead() for lead in self]
+
+    def take(self, indices: List[int]) -> "LeadBatch":
+        """New batch with the given rows, sharing string dictionaries"""
+        batch = LeadBatch.__new__(LeadBatch)
+        batch.name = [self.name[i] for i in indices]
+        batch.address = self.address.take(indices)
+        batch.phone = self.phone.take(indices)
+        batch.website = self.website.take(indices)
+        batch.google_maps_url = self.google_maps_url.take(indices)
+        batch.rating = array("d", (self.rating[i] for i in indices))
+        batch.rating_is_int = array("B", (self.rating_is_int[i] for i in indices))
+        batch.user_ratings_total = array("q", (self.user_ratings_total[i] for i in indices))
+        batch.place_id = [self.place_id[i] for i in indices]
+        batch.keywords = self.keywords.take(indices)
+        return batch
@@ -1,4 +1,4 @@
-from .models import BusinessLead
+from .models import BusinessLead, CompactLead
 
-def has_website(lead: BusinessLead) -> bool:
+def has_website(lead: BusinessLead | CompactLead) -> bool:
     return bool(lead.website)
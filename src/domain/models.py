@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 @dataclass
 class BusinessLead:
@@ -10,3 +10,50 @@ class BusinessLead:
     rating: float | None
     user_ratings_total: int | None
     place_id: str | None
+    keywords: list[str] = field(default_factory=list)  # search keywords that found this lead
+
+
+@dataclass(frozen=True, slots=True)
+class CompactLead:
+    """
+    Slotted, immutable BusinessLead for holding large numbers of leads.
+    No per-instance __dict__; keywords is a tuple so the lead is hashable.
+    """
+    name: str
+    address: str
+    phone: str | None
+    website: str | None
+    google_maps_url: str | None
+    rating: float | None
+    user_ratings_total: int | None
+    place_id: str | None
+    keywords: tuple[str, ...] = ()
+
+    @classmethod
+    def from_lead(cls, lead: "BusinessLead | CompactLead") -> "CompactLead":
+        if isinstance(lead, CompactLead):
+            return lead
+        return cls(
+            name=lead.name,
+            address=lead.address,
+            phone=lead.phone,
+            website=lead.website,
+            google_maps_url=lead.google_maps_url,
+            rating=lead.rating,
+            user_ratings_total=lead.user_ratings_total,
+            place_id=lead.place_id,
+            keywords=tuple(lead.keywords),
+        )
+
+    def to_lead(self) -> BusinessLead:
+        return BusinessLead(
+            name=self.name,
+            address=self.address,
+            phone=self.phone,
+            website=self.website,
+            google_maps_url=self.google_maps_url,
+            rating=self.rating,
+            user_ratings_total=self.user_ratings_total,
+            place_id=self.place_id,
+            keywords=list(self.keywords),
+        )
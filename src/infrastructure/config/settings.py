@@ -1,5 +1,6 @@
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -21,15 +22,45 @@ class Settings:
     # Cost tracking
     enable_cost_tracking: bool = True
 
+    # API key pool: with more than one key, requests are spread across keys
+    google_maps_api_keys: List[str] = field(default_factory=list)
+    key_cooldown_seconds: float = 60.0
+
+    # Hedged requests: duplicate slow requests to cut tail latency (costs extra calls)
+    enable_hedging: bool = False
+    hedge_percentile: float = 0.95
+    hedge_max_ratio: float = 0.05
+
+    # Save raw API responses here (for decoder benchmarks); None = off
+    record_responses_dir: str | None = None
+
+    # Offline gazetteer index (see scripts/build_gazetteer.py); None = always use the API
+    gazetteer_path: str | None = None
+
+    # Export format: csv, csv.gz, csv.zst or xlsx
+    export_format: str = "csv"
+
     @classmethod
     def from_env(cls) -> "Settings":
-        api_key = os.getenv("GOOGLE_MAPS_API_KEY")
+        api_keys = [
+            key.strip()
+            for key in os.getenv("GOOGLE_MAPS_API_KEYS", "").split(",")
+            if key.strip()
+        ]
+        api_key = os.getenv("GOOGLE_MAPS_API_KEY") or (api_keys[0] if api_keys else None)
         if not api_key:
             raise RuntimeError(
                 "GOOGLE_MAPS_API_KEY is not set. "
                 "Add it to your .env file or environment variables."
             )
-        return cls(google_maps_api_key=api_key)
+        return cls(
+            google_maps_api_key=api_key,
+            google_maps_api_keys=api_keys,
+            export_format=os.getenv("EXPORT_FORMAT", "csv"),
+            gazetteer_path=os.getenv("GAZETTEER_PATH"),
+            record_responses_dir=os.getenv("RECORD_RESPONSES_DIR"),
+            enable_hedging=os.getenv("ENABLE_HEDGING", "false").lower() == "true",
+        )
 
 
 # ✅ this is the missing instantiation
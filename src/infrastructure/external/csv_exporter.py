@@ -1,17 +1,115 @@
 import csv
+import gzip
+import io
+from contextlib import ExitStack
+from itertools import chain
 from pathlib import Path
-from typing import Iterable
+from typing import IO, Iterable
 
 from src.domain.models import BusinessLead
+from src.infrastructure.monitoring import tracer
+
+# Buffer size used for every output stream. Large writes keep syscalls and
+# compressor flushes to a minimum when exporting big batches.
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+FIELDNAMES = [
+    "name",
+    "address",
+    "phone",
+    "website",
+    "google_maps_url",
+    "rating",
+    "user_ratings_total",
+    "place_id",
+    "keywords",
+]
+
+
+def lead_to_row(lead: BusinessLead) -> list:
+    """
+    Convert a BusinessLead into a list of cell values ordered as FIELDNAMES.
+    """
+    return [
+        lead.name,
+        lead.address,
+        lead.phone or "",
+        lead.website or "",
+        lead.google_maps_url or "",
+        lead.rating if lead.rating is not None else "",
+        lead.user_ratings_total if lead.user_ratings_total is not None else "",
+        lead.place_id or "",
+        ";".join(lead.keywords),
+    ]
+
+
+def _require_zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError(
+            "zstandard is required for .zst exports. "
+            "Install it with: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def compression_suffix(path: str | Path) -> str:
+    """Lowercased last suffix of path (".gz", ".zst", ".csv", ...)"""
+    return Path(path).suffix.lower()
+
+
+def open_text_writer(stack: ExitStack, path: Path) -> IO[str]:
+    """
+    Open a buffered UTF-8 text stream for path, compressing according to its
+    suffix (.gz or .zst). Every layer is registered on stack so closing the
+    stack flushes and closes them in the right order.
+    """
+    suffix = compression_suffix(path)
+    if suffix == ".zst":
+        zstandard = _require_zstandard()
+
+    raw: IO[bytes] = stack.enter_context(path.open("wb", buffering=WRITE_BUFFER_SIZE))
+
+    if suffix == ".gz":
+        raw = stack.enter_context(
+            gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=6, filename="")
+        )
+    elif suffix == ".zst":
+        raw = stack.enter_context(
+            zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False)
+        )
+
+    # Keep a large buffer between the text layer and the (possibly compressed)
+    # stream so the compressor always sees big chunks.
+    buffered = io.BufferedWriter(raw, buffer_size=WRITE_BUFFER_SIZE)
+    text = io.TextIOWrapper(buffered, encoding="utf-8", newline="")
+    # detach() flushes each wrapper without closing the layer beneath it;
+    # the underlying streams are closed by the stack afterwards.
+    stack.callback(buffered.detach)
+    stack.callback(text.detach)
+    return text
 
 
 class CsvExporter:
+    """
+    Writes leads to CSV. Files ending in .csv.gz or .csv.zst are compressed
+    on the fly; rows are streamed so the input is never materialized.
+    """
+
+    def check_available(self, filename: str | Path) -> None:
+        """Raise RuntimeError if the compressor filename needs is not installed"""
+        if compression_suffix(filename) == ".zst":
+            _require_zstandard()
+
+    @tracer.traced("CsvExporter.export", "export")
     def export(self, filename: str | Path, leads: Iterable[BusinessLead]) -> None:
         """
         Export an iterable of BusinessLead objects to a CSV file.
         """
-        leads = list(leads)
-        if not leads:
+        leads = iter(leads)
+        first = next(leads, None)
+        if first is None:
             # You may choose to still create an empty file if you prefer
             print(f"[CsvExporter] No leads to export for {filename}")
             return
@@ -19,34 +117,13 @@ class CsvExporter:
         path = Path(filename)
         path.parent.mkdir(parents=True, exist_ok=True)
 
-        fieldnames = [
-            "name",
-            "address",
-            "phone",
-            "website",
-            "google_maps_url",
-            "rating",
-            "user_ratings_total",
-            "place_id",
-        ]
-
-        with path.open("w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for lead in leads:
-                writer.writerow(
-                    {
-                        "name": lead.name,
-                        "address": lead.address,
-                        "phone": lead.phone or "",
-                        "website": lead.website or "",
-                        "google_maps_url": lead.google_maps_url or "",
-                        "rating": lead.rating if lead.rating is not None else "",
-                        "user_ratings_total": (
-                            lead.user_ratings_total if lead.user_ratings_total is not None else ""
-                        ),
-                        "place_id": lead.place_id or "",
-                    }
-                )
-
-        print(f"[CsvExporter] Exported {len(leads)} leads to {path}")
+        count = 0
+        with ExitStack() as stack:
+            f = open_text_writer(stack, path)
+            writer = csv.writer(f)
+            writer.writerow(FIELDNAMES)
+            for lead in chain((first,), leads):
+                writer.writerow(lead_to_row(lead))
+                count += 1
+
+        print(f"[CsvExporter] Exported {count} leads to {path}")
@@ -0,0 +1,183 @@
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+STATE_VERSION = 2
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class MergeState:
+    """
+    Bookkeeping for incremental merges, stored next to the merged output:
+
+        merged.csv.merge-state.json   source files (size, mtime, sha256),
+                                      header, dedupe field and the merged
+                                      output's own size and mtime
+        merged.csv.merge-ids          dedupe index, one id per line (append-only)
+
+    With it, a later merge only reads inputs that are new or changed and
+    appends only rows whose id has not been written before.
+
+    State is discarded when the output no longer matches its recorded
+    fingerprint (it was rewritten by something else). Appends are journaled:
+    begin_append() records the lengths of the output and the id index, and if
+    a run dies before commit(), the next load truncates both back to them.
+    """
+
+    def __init__(self, output_file: Union[str, Path], dedupe_field: str) -> None:
+        self.output_path = Path(output_file)
+        self.dedupe_field = dedupe_field
+        self.fieldnames: List[str] = []
+        self.sources: Dict[str, Dict[str, Union[int, str]]] = {}
+        self.output: Dict[str, int] = {}
+        self.pending: Optional[Dict[str, int]] = None
+
+    @property
+    def state_path(self) -> Path:
+        return self.output_path.with_name(self.output_path.name + ".merge-state.json")
+
+    @property
+    def ids_path(self) -> Path:
+        return self.output_path.with_name(self.output_path.name + ".merge-ids")
+
+    def _output_fingerprint(self) -> Dict[str, int]:
+        stat = self.output_path.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    @classmethod
+    def load(cls, output_file: Union[str, Path], dedupe_field: str) -> "MergeState | None":
+        """
+        Return the stored state, or None if it is missing, does not match, or
+        the output was changed since the state was saved. An append left
+        unfinished by an earlier run is rolled back first.
+        """
+        state = cls(output_file, dedupe_field)
+        if not (state.output_path.exists() and state.state_path.exists() and state.ids_path.exists()):
+            return None
+        try:
+            data = json.loads(state.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != STATE_VERSION or data.get("dedupe_field") != dedupe_field:
+            return None
+        state.fieldnames = data["fieldnames"]
+        state.sources = data["sources"]
+        state.output = data["output"]
+        state.pending = data.get("pending")
+        if state.pending and not state._roll_back():
+            return None
+        if state._output_fingerprint() != state.output:
+            return None
+        return state
+
+    @classmethod
+    def clear(cls, output_file: Union[str, Path]) -> None:
+        """Delete the state files of output_file, e.g. before rewriting it"""
+        state = cls(output_file, "")
+        state.state_path.unlink(missing_ok=True)
+        state.ids_path.unlink(missing_ok=True)
+
+    def _roll_back(self) -> bool:
+        """Truncate output and id index to their lengths before the unfinished append"""
+        output_size = self.pending["output_size"]
+        ids_size = self.pending["ids_size"]
+        if output_size != self.output["size"]:
+            return False
+        if self.output_path.stat().st_size < output_size or self.ids_path.stat().st_size < ids_size:
+            return False
+        with self.output_path.open("r+b") as f:
+            f.truncate(output_size)
+        with self.ids_path.open("r+b") as f:
+            f.truncate(ids_size)
+        self.commit()
+        return True
+
+    @classmethod
+    def rebuild(
+        cls,
+        output_file: Union[str, Path],
+        dedupe_field: str,
+        input_files: Iterable[Union[str, Path]],
+    ) -> "MergeState":
+        """Create state for an existing merged output (after a full merge)"""
+        state = cls(output_file, dedupe_field)
+        with state.output_path.open("r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            state.fieldnames = list(reader.fieldnames or [])
+            ids = [row.get(dedupe_field, "") for row in reader]
+        state.ids_path.write_text("".join(f"{i}\n" for i in ids if i), encoding="utf-8")
+        for path in input_files:
+            path = Path(path)
+            if path.exists():
+                state.record_source(path)
+        state.commit()
+        return state
+
+    def begin_append(self) -> None:
+        """Journal the current output and id index lengths before appending"""
+        self.pending = {
+            "output_size": self.output_path.stat().st_size,
+            "ids_size": self.ids_path.stat().st_size,
+        }
+        self.save()
+
+    def commit(self) -> None:
+        """Record the output as it is now and clear the journal"""
+        self.output = self._output_fingerprint()
+        self.pending = None
+        self.save()
+
+    def save(self) -> None:
+        data = {
+            "version": STATE_VERSION,
+            "dedupe_field": self.dedupe_field,
+            "fieldnames": self.fieldnames,
+            "sources": self.sources,
+            "output": self.output,
+            "pending": self.pending,
+        }
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp_path.replace(self.state_path)
+
+    def is_changed(self, path: Path) -> bool:
+        """
+        True if path is new or its content changed since it was last merged.
+        Size and mtime are checked first; the hash only when they differ.
+        """
+        known = self.sources.get(str(path.resolve()))
+        if not known:
+            return True
+        stat = path.stat()
+        if stat.st_size == known["size"] and stat.st_mtime_ns == known["mtime_ns"]:
+            return False
+        if stat.st_size == known["size"] and file_sha256(path) == known["sha256"]:
+            # Touched but identical: remember the new mtime and skip it
+            self.record_source(path)
+            return False
+        return True
+
+    def record_source(self, path: Path) -> None:
+        stat = path.stat()
+        self.sources[str(path.resolve())] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": file_sha256(path),
+        }
+
+    def load_ids(self) -> Set[str]:
+        with self.ids_path.open("r", encoding="utf-8") as f:
+            return {line.rstrip("\n") for line in f}
+
+    def append_ids(self, ids: List[str]) -> None:
+        with self.ids_path.open("a", encoding="utf-8") as f:
+            f.writelines(f"{i}\n" for i in ids)
@@ -3,6 +3,8 @@ from pathlib import Path
 from typing import List, Union
 import glob
 
+from src.infrastructure.external.csv_merge_state import MergeState
+
 
 class CsvMerger:
     """
@@ -14,7 +16,8 @@ class CsvMerger:
         self, 
         input_files: List[Union[str, Path]], 
         output_file: Union[str, Path],
-        dedupe_field: str = "place_id"
+        dedupe_field: str = "place_id",
+        incremental: bool = False
     ) -> dict:
         """
         Merge multiple CSV files into one, removing duplicates based on dedupe_field.
@@ -23,12 +26,18 @@ class CsvMerger:
             input_files: List of CSV file paths to merge
             output_file: Output path for the merged CSV
             dedupe_field: Field name to use for deduplication (default: place_id)
+            incremental: Only read new or changed inputs and append unseen rows,
+                using the merge state stored next to output_file (see MergeState)
             
         Returns:
             Dictionary with merge statistics
         """
+        if incremental:
+            return self._merge_incremental(input_files, output_file, dedupe_field)
+
         seen_ids = set()
         merged_rows = []
+        fieldnames = []
         total_rows = 0
         files_processed = 0
         
@@ -41,7 +50,10 @@ class CsvMerger:
             try:
                 with file_path.open('r', encoding='utf-8') as f:
                     reader = csv.DictReader(f)
-                    fieldnames = reader.fieldnames
+                    # Union of headers so files from older runs (fewer columns) can be mixed in
+                    for name in reader.fieldnames or []:
+                        if name not in fieldnames:
+                            fieldnames.append(name)
                     
                     for row in reader:
                         total_rows += 1
@@ -65,6 +77,8 @@ class CsvMerger:
         if merged_rows:
             output_path = Path(output_file)
             output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Incremental state describes the file being replaced
+            MergeState.clear(output_path)
             
             with output_path.open('w', newline='', encoding='utf-8') as f:
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -97,12 +111,129 @@ class CsvMerger:
                 'output_file': None
             }
     
+    def _merge_incremental(
+        self,
+        input_files: List[Union[str, Path]],
+        output_file: Union[str, Path],
+        dedupe_field: str
+    ) -> dict:
+        """
+        Append rows from new or changed inputs to an existing merged output.
+        Falls back to a full merge (and records state) when there is no usable
+        state yet or an input brings columns the merged file does not have.
+        Rows removed from a source are not removed from the merged output;
+        run a full merge to rebuild it from scratch.
+
+        Appends are journaled in the state, so an interrupted run is rolled
+        back and redone by the next one instead of duplicating rows.
+        """
+        output_path = Path(output_file)
+        state = MergeState.load(output_path, dedupe_field)
+        if state is None:
+            print(
+                f"[CsvMerger] No usable merge state for {output_path.name} "
+                "(missing, or the output changed since); running a full merge"
+            )
+            return self._full_merge_with_state(input_files, output_path, dedupe_field)
+
+        changed_files = []
+        skipped = 0
+        for file_path in input_files:
+            file_path = Path(file_path)
+            if not file_path.exists():
+                print(f"[CsvMerger] Warning: File not found: {file_path}")
+                continue
+            if state.is_changed(file_path):
+                changed_files.append(file_path)
+            else:
+                skipped += 1
+
+        if not changed_files:
+            state.save()
+            print(f"[CsvMerger] {output_path.name} is up to date ({skipped} files unchanged)")
+            return {
+                'files_processed': 0,
+                'files_skipped': skipped,
+                'total_rows_read': 0,
+                'unique_rows_written': 0,
+                'duplicates_removed': 0,
+                'output_file': str(output_path)
+            }
+
+        # New columns cannot be appended under the existing header
+        for file_path in changed_files:
+            with file_path.open('r', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            if any(name not in state.fieldnames for name in header):
+                print(f"[CsvMerger] {file_path.name} adds new columns; running a full merge")
+                return self._full_merge_with_state(input_files, output_path, dedupe_field)
+
+        seen_ids = state.load_ids()
+        new_ids = []
+        total_rows = 0
+        files_processed = 0
+
+        state.begin_append()
+        with output_path.open('a', newline='', encoding='utf-8') as out:
+            writer = csv.DictWriter(out, fieldnames=state.fieldnames)
+            for file_path in changed_files:
+                try:
+                    with file_path.open('r', encoding='utf-8') as f:
+                        for row in csv.DictReader(f):
+                            total_rows += 1
+                            place_id = row.get(dedupe_field, '')
+                            if not place_id or place_id in seen_ids:
+                                continue
+                            seen_ids.add(place_id)
+                            new_ids.append(place_id)
+                            writer.writerow(row)
+                except Exception as e:
+                    print(f"[CsvMerger] Error processing {file_path}: {e}")
+                    continue
+
+                state.record_source(file_path)
+                files_processed += 1
+                print(f"[CsvMerger] Processed: {file_path.name}")
+
+        state.append_ids(new_ids)
+        state.commit()
+
+        stats = {
+            'files_processed': files_processed,
+            'files_skipped': skipped,
+            'total_rows_read': total_rows,
+            'unique_rows_written': len(new_ids),
+            'duplicates_removed': total_rows - len(new_ids),
+            'output_file': str(output_path)
+        }
+
+        print(f"\n[CsvMerger] Incremental Merge Complete:")
+        print(f"  Files processed: {stats['files_processed']} ({skipped} unchanged, skipped)")
+        print(f"  Total rows read: {stats['total_rows_read']}")
+        print(f"  New rows appended: {stats['unique_rows_written']}")
+        print(f"  Duplicates removed: {stats['duplicates_removed']}")
+        print(f"  Output: {stats['output_file']}")
+
+        return stats
+
+    def _full_merge_with_state(
+        self,
+        input_files: List[Union[str, Path]],
+        output_path: Path,
+        dedupe_field: str
+    ) -> dict:
+        stats = self.merge_files(input_files, output_path, dedupe_field)
+        if stats['output_file']:
+            MergeState.rebuild(output_path, dedupe_field, input_files)
+        return stats
+    
     def merge_by_pattern(
         self,
         pattern: str,
         output_file: Union[str, Path],
         base_dir: Union[str, Path] = "output",
-        dedupe_field: str = "place_id"
+        dedupe_field: str = "place_id",
+        incremental: bool = False
     ) -> dict:
         """
         Merge CSV files matching a glob pattern.
@@ -112,6 +243,7 @@ class CsvMerger:
             output_file: Output path for the merged CSV
             base_dir: Base directory to search for files (default: output)
             dedupe_field: Field name to use for deduplication (default: place_id)
+            incremental: Only process inputs added or changed since the last merge
             
         Returns:
             Dictionary with merge statistics
@@ -141,7 +273,7 @@ class CsvMerger:
             print(f"  - {Path(f).name}")
         print()
         
-        return self.merge_files(matching_files, output_file, dedupe_field)
+        return self.merge_files(matching_files, output_file, dedupe_field, incremental)
     
     def merge_categories(
         self,
@@ -150,7 +282,8 @@ class CsvMerger:
         output_file: Union[str, Path],
         base_dir: Union[str, Path] = "output",
         dedupe_field: str = "place_id",
-        website_filter: str = None
+        website_filter: str = None,
+        incremental: bool = False
     ) -> dict:
         """
         Merge specific categories across specific postcodes.
@@ -162,6 +295,7 @@ class CsvMerger:
             base_dir: Base directory to search for files (default: output)
             dedupe_field: Field name to use for deduplication (default: place_id)
             website_filter: Filter by 'with_website', 'without_website', or None for both
+            incremental: Only process inputs added or changed since the last merge
             
         Returns:
             Dictionary with merge statistics
@@ -206,4 +340,4 @@ class CsvMerger:
             print(f"  - {Path(f).name}")
         print()
         
-        return self.merge_files(files_to_merge, output_file, dedupe_field)
+        return self.merge_files(files_to_merge, output_file, dedupe_field, incremental)
@@ -0,0 +1,35 @@
+from pathlib import Path
+
+from src.infrastructure.external.csv_exporter import CsvExporter
+from src.infrastructure.external.xlsx_exporter import XlsxExporter
+
+# Output extensions and the exporter that handles them.
+# Compressed CSV is handled by CsvExporter based on the trailing suffix.
+EXPORTERS = {
+    ".csv": CsvExporter,
+    ".csv.gz": CsvExporter,
+    ".csv.zst": CsvExporter,
+    ".xlsx": XlsxExporter,
+}
+
+
+def get_exporter(filename: str | Path) -> CsvExporter | XlsxExporter:
+    """
+    Return the exporter matching the extension of filename.
+
+    Raises ValueError for an unknown extension and RuntimeError when the
+    library the format needs is missing, so callers can check before doing
+    any paid work.
+
+    Example:
+        get_exporter("output/lu1_barber.csv.gz").export("output/lu1_barber.csv.gz", leads)
+    """
+    name = Path(filename).name.lower()
+    for extension in EXPORTERS:
+        if name.endswith(extension):
+            exporter = EXPORTERS[extension]()
+            exporter.check_available(filename)
+            return exporter
+
+    supported = ", ".join(EXPORTERS)
+    raise ValueError(f"Unsupported export format for '{filename}'. Supported: {supported}")
@@ -0,0 +1,57 @@
+from itertools import chain
+from pathlib import Path
+from typing import Iterable
+
+from src.domain.models import BusinessLead
+from src.infrastructure.external.csv_exporter import FIELDNAMES, lead_to_row
+from src.infrastructure.monitoring import tracer
+
+
+def _require_openpyxl():
+    try:
+        import openpyxl
+    except ImportError as e:
+        raise RuntimeError(
+            "openpyxl is required for .xlsx exports. "
+            "Install it with: pip install openpyxl"
+        ) from e
+    return openpyxl
+
+
+class XlsxExporter:
+    """
+    Writes leads to an .xlsx workbook using openpyxl's write-only mode, which
+    streams rows to disk instead of building the whole sheet in memory.
+    """
+
+    def check_available(self, filename: str | Path) -> None:
+        """Raise RuntimeError if openpyxl is not installed"""
+        _require_openpyxl()
+
+    @tracer.traced("XlsxExporter.export", "export")
+    def export(self, filename: str | Path, leads: Iterable[BusinessLead]) -> None:
+        """
+        Export an iterable of BusinessLead objects to an Excel workbook.
+        """
+        Workbook = _require_openpyxl().Workbook
+
+        leads = iter(leads)
+        first = next(leads, None)
+        if first is None:
+            print(f"[XlsxExporter] No leads to export for {filename}")
+            return
+
+        path = Path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title="Leads")
+        sheet.append(FIELDNAMES)
+
+        count = 0
+        for lead in chain((first,), leads):
+            sheet.append(lead_to_row(lead))
+            count += 1
+
+        workbook.save(path)
+        print(f"[XlsxExporter] Exported {count} leads to {path}")
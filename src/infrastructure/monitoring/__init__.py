@@ -1,5 +1,8 @@
 from .api_cost_tracker import APICostTracker, APICostConfig, APICallStats
 from .rate_limiter import RateLimiter, RateLimitConfig
+from .api_key_pool import ApiKeyPool, ApiKeyPoolConfig, PooledKey
+from .tracer import Tracer, tracer
+from .hedging import HedgingPolicy, HedgingConfig, HedgeExecutor
 
 __all__ = [
     "APICostTracker",
@@ -7,4 +10,12 @@ __all__ = [
     "APICallStats",
     "RateLimiter",
     "RateLimitConfig",
+    "ApiKeyPool",
+    "ApiKeyPoolConfig",
+    "PooledKey",
+    "Tracer",
+    "tracer",
+    "HedgingPolicy",
+    "HedgingConfig",
+    "HedgeExecutor",
 ]
@@ -1,3 +1,4 @@
+import threading
 from dataclasses import dataclass, field
 from typing import Dict
 from datetime import datetime
@@ -20,6 +21,8 @@ class APICallStats:
     geocoding_calls: int = 0
     places_search_calls: int = 0
     place_details_calls: int = 0
+    hedged_calls: int = 0
+    hedge_cost: float = 0.0
     total_cost: float = 0.0
     started_at: datetime = field(default_factory=datetime.now)
     
@@ -38,6 +41,12 @@ class APICallStats:
         self.place_details_calls += 1
         self.total_cost += cost_config.place_details_per_1000 / 1000
     
+    def add_hedged_call(self, price_per_1000: float) -> None:
+        """Record a duplicate (hedge) request; counted apart from the regular calls"""
+        self.hedged_calls += 1
+        self.hedge_cost += price_per_1000 / 1000
+        self.total_cost += price_per_1000 / 1000
+    
     def get_summary(self) -> Dict[str, any]:
         """Get a summary of API usage and costs"""
         elapsed = datetime.now() - self.started_at
@@ -48,8 +57,11 @@ class APICallStats:
             "total_calls": (
                 self.geocoding_calls + 
                 self.places_search_calls + 
-                self.place_details_calls
+                self.place_details_calls +
+                self.hedged_calls
             ),
+            "hedged_calls": self.hedged_calls,
+            "hedge_cost_usd": round(self.hedge_cost, 4),
             "total_cost_usd": round(self.total_cost, 4),
             "elapsed_seconds": int(elapsed.total_seconds()),
         }
@@ -63,18 +75,32 @@ class APICostTracker:
     def __init__(self, cost_config: APICostConfig | None = None) -> None:
         self.cost_config = cost_config or APICostConfig()
         self.stats = APICallStats()
+        self._lock = threading.Lock()
     
     def track_geocoding(self) -> None:
         """Track a geocoding API call"""
-        self.stats.add_geocoding_call(self.cost_config)
+        with self._lock:
+            self.stats.add_geocoding_call(self.cost_config)
     
     def track_places_search(self) -> None:
         """Track a places search API call"""
-        self.stats.add_places_search_call(self.cost_config)
+        with self._lock:
+            self.stats.add_places_search_call(self.cost_config)
     
     def track_place_details(self) -> None:
         """Track a place details API call"""
-        self.stats.add_place_details_call(self.cost_config)
+        with self._lock:
+            self.stats.add_place_details_call(self.cost_config)
+    
+    def track_hedge(self, api: str) -> None:
+        """Track a hedge request to api ("geocoding", "places_search" or "place_details")"""
+        prices = {
+            "geocoding": self.cost_config.geocoding_per_1000,
+            "places_search": self.cost_config.places_text_search_per_1000,
+            "place_details": self.cost_config.place_details_per_1000,
+        }
+        with self._lock:
+            self.stats.add_hedged_call(prices[api])
     
     def get_stats(self) -> APICallStats:
         """Get current statistics"""
@@ -93,6 +119,8 @@ class APICostTracker:
         print(f"Geocoding calls:      {summary['geocoding_calls']:>6}")
         print(f"Places search calls:  {summary['places_search_calls']:>6}")
         print(f"Place details calls:  {summary['place_details_calls']:>6}")
+        if summary["hedged_calls"]:
+            print(f"Hedged calls:         {summary['hedged_calls']:>6}  (${summary['hedge_cost_usd']:.4f})")
         print(f"{'─'*50}")
         print(f"Total API calls:      {summary['total_calls']:>6}")
         print(f"Total cost (USD):     ${summary['total_cost_usd']:>6.4f}")
@@ -0,0 +1,136 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .api_cost_tracker import APICostTracker, APICostConfig
+from .rate_limiter import RateLimiter, RateLimitConfig
+
+
+# Google statuses that mean a key has exhausted its quota or been refused
+COOLDOWN_STATUSES = ("OVER_QUERY_LIMIT", "REQUEST_DENIED")
+
+
+@dataclass
+class PooledKey:
+    """A single API key with its own rate limiter and cost tracker"""
+    api_key: str
+    rate_limiter: RateLimiter
+    cost_tracker: APICostTracker
+    cooldown_until: float = 0.0
+    cooldowns: int = 0
+
+    @property
+    def label(self) -> str:
+        """Masked key suitable for logs and reports"""
+        return f"...{self.api_key[-4:]}"
+
+    def is_available(self, now: float) -> bool:
+        return now >= self.cooldown_until
+
+    def headroom(self) -> float:
+        """
+        Fraction of quota left, taking the tighter of the per-minute and
+        per-day windows (1.0 = unused, 0.0 = exhausted)
+        """
+        usage = self.rate_limiter.get_current_usage()
+        return 1 - max(usage["minute_usage_percent"], usage["day_usage_percent"]) / 100
+
+
+@dataclass
+class ApiKeyPoolConfig:
+    """Configuration for the API key pool"""
+    cooldown_seconds: float = 60.0  # How long a failing key is rotated out
+    rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
+    cost: APICostConfig = field(default_factory=APICostConfig)
+
+
+class ApiKeyPool:
+    """
+    Spreads requests over several Google Maps API keys.
+
+    Each key has its own rate limiter and cost tracker. Requests are routed to
+    the key with the most remaining headroom, and keys answering with
+    OVER_QUERY_LIMIT or REQUEST_DENIED are pulled out of rotation for a while.
+    """
+
+    def __init__(self, api_keys: List[str], config: ApiKeyPoolConfig | None = None) -> None:
+        if not api_keys:
+            raise ValueError("ApiKeyPool requires at least one API key")
+        self.config = config or ApiKeyPoolConfig()
+        self.keys = [
+            PooledKey(
+                api_key=api_key,
+                rate_limiter=RateLimiter(self.config.rate_limit),
+                cost_tracker=APICostTracker(self.config.cost),
+            )
+            for api_key in dict.fromkeys(api_keys)  # drop duplicates, keep order
+        ]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def acquire(self) -> PooledKey:
+        """
+        Pick the available key with the most headroom.
+        Waits for the earliest cooldown to expire if every key is rotated out.
+        """
+        while True:
+            with self._lock:
+                now = time.time()
+                available = [key for key in self.keys if key.is_available(now)]
+                if available:
+                    # Most headroom first; least recently used breaks ties
+                    return max(
+                        available,
+                        key=lambda key: (key.headroom(), -key.rate_limiter.last_request_time),
+                    )
+                soonest = min(self.keys, key=lambda key: key.cooldown_until)
+                wait_time = soonest.cooldown_until - now
+
+            # Sleep without the lock so report_status and other threads can
+            # proceed; cooldowns are re-checked afterwards
+            print(f"[ApiKeyPool] All keys cooling down. Waiting {wait_time:.2f}s...")
+            time.sleep(wait_time)
+
+    def report_status(self, key: PooledKey, status: str | None) -> bool:
+        """
+        Record the API status returned for a request made with key.
+        Returns False if the key was rotated out and the request should be retried.
+        """
+        if status not in COOLDOWN_STATUSES:
+            return True
+
+        with self._lock:
+            key.cooldown_until = time.time() + self.config.cooldown_seconds
+            key.cooldowns += 1
+        print(
+            f"[ApiKeyPool] Key {key.label} returned {status}. "
+            f"Rotated out for {self.config.cooldown_seconds:.0f}s"
+        )
+        return False
+
+    def get_summary(self) -> Dict[str, Dict[str, any]]:
+        """Per-key usage and cost, keyed by masked API key"""
+        now = time.time()
+        return {
+            key.label: {
+                **key.cost_tracker.get_summary(),
+                "available": key.is_available(now),
+                "cooldowns": key.cooldowns,
+            }
+            for key in self.keys
+        }
+
+    def print_summary(self) -> None:
+        """Print a formatted per-key usage table"""
+        print("PER-KEY USAGE")
+        print(f"{'─'*50}")
+        for label, summary in self.get_summary().items():
+            state = "active" if summary["available"] else "cooling down"
+            print(
+                f"{label:<10} calls: {summary['total_calls']:>6}  "
+                f"cost: ${summary['total_cost_usd']:>8.4f}  ({state})"
+            )
+        print("="*50 + "\n")
@@ -0,0 +1,134 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Optional
+
+from .tracer import tracer
+
+
+@dataclass
+class HedgingConfig:
+    """
+    Configuration for hedged requests
+
+    After a request has been outstanding longer than the observed latency
+    percentile, a duplicate is sent and whichever answers first is used.
+    """
+    percentile: float = 0.95  # Hedge requests slower than this share of past ones
+    max_hedge_ratio: float = 0.05  # At most 5% of requests get a hedge
+    min_samples: int = 20  # Latencies to observe before hedging starts
+    min_delay_seconds: float = 0.2  # Never hedge sooner than this
+    window_size: int = 200  # Recent latencies used for the percentile
+
+
+class HedgeExecutor:
+    """
+    Worker threads shared by every HedgingPolicy of a collector.
+
+    Primary requests are always submitted. Hedges go through try_submit,
+    which refuses when no worker is idle, so a hedge never queues behind
+    primaries (or behind losing requests that could not be cancelled).
+    """
+
+    def __init__(self, max_workers: int = 16) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="hedge")
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._busy -= 1
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        # The worker is already counted as busy. Submit outside _lock: a
+        # future that finished already runs _release immediately.
+        future = self._executor.submit(tracer.profiled(fn), *args)
+        future.add_done_callback(self._release)
+        return future
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        with self._lock:
+            self._busy += 1
+        return self._submit(fn, *args)
+
+    def has_idle_worker(self) -> bool:
+        with self._lock:
+            return self._busy < self.max_workers
+
+    def try_submit(self, fn: Callable[..., Any], *args: Any) -> Optional[Future]:
+        """Submit fn only if a worker is idle right now, else return None"""
+        with self._lock:
+            if self._busy >= self.max_workers:
+                return None
+            self._busy += 1
+        return self._submit(fn, *args)
+
+    def shutdown(self) -> None:
+        """Stop the workers; requests still in flight finish in the background"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class HedgingPolicy:
+    """
+    Decides when to send a duplicate (hedge) request, based on the latencies
+    observed so far, and caps hedges at a small share of traffic.
+    One policy per service, since each API has its own latency profile;
+    the policies of a collector share one HedgeExecutor.
+    """
+
+    def __init__(
+        self,
+        config: HedgingConfig | None = None,
+        executor: HedgeExecutor | None = None,
+    ) -> None:
+        self.config = config or HedgingConfig()
+        self.latencies: Deque[float] = deque(maxlen=self.config.window_size)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.executor = executor or HedgeExecutor()
+        self._lock = threading.Lock()
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging, or None if not enough data yet"""
+        with self._lock:
+            if len(self.latencies) < self.config.min_samples:
+                return None
+            ordered = sorted(self.latencies)
+        index = min(int(len(ordered) * self.config.percentile), len(ordered) - 1)
+        return max(ordered[index], self.config.min_delay_seconds)
+
+    def record_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def record_latency(self, seconds: float) -> None:
+        with self._lock:
+            self.latencies.append(seconds)
+
+    def try_hedge(self) -> bool:
+        """Claim a hedge if the hedge ratio allows it"""
+        with self._lock:
+            if self.hedges + 1 > self.requests * self.config.max_hedge_ratio:
+                return False
+            self.hedges += 1
+            return True
+
+    def release_hedge(self) -> None:
+        """Give back a hedge claimed with try_hedge that was not sent"""
+        with self._lock:
+            self.hedges -= 1
+
+    def record_hedge_win(self) -> None:
+        with self._lock:
+            self.hedge_wins += 1
+
+    def get_summary(self) -> dict:
+        return {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "hedge_delay_seconds": self.hedge_delay(),
+        }
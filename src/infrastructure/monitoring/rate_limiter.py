@@ -1,8 +1,11 @@
+import threading
 import time
 from dataclasses import dataclass
 from collections import deque
 from typing import Deque
 
+from .tracer import tracer
+
 
 @dataclass
 class RateLimitConfig:
@@ -29,6 +32,8 @@ class RateLimiter:
         self.minute_window: Deque[float] = deque()
         self.day_window: Deque[float] = deque()
         self.last_request_time: float = 0.0
+        # Guards the windows so concurrent searches share them safely
+        self._lock = threading.Lock()
     
     def _clean_old_timestamps(self, window: Deque[float], max_age: float) -> None:
         """Remove timestamps older than max_age seconds"""
@@ -36,11 +41,39 @@ class RateLimiter:
         while window and (current_time - window[0]) > max_age:
             window.popleft()
     
+    @tracer.traced("RateLimiter.wait_if_needed", "rate_limit")
     def wait_if_needed(self) -> None:
         """
         Wait if necessary to respect rate limits
         Checks both per-minute and per-day limits
         """
+        while True:
+            with self._lock:
+                wait_time = self._reserve()
+            if wait_time <= 0:
+                return
+            if wait_time > self.config.min_delay_seconds:
+                print(f"[RateLimiter] Per-minute limit reached. Waiting {wait_time:.2f}s...")
+            # Sleep without the lock so usage queries and other callers are
+            # not blocked; the windows are re-checked afterwards
+            time.sleep(wait_time)
+
+    def try_acquire(self) -> bool:
+        """
+        Record a request only if the limits allow it right now. Never sleeps
+        or raises; returns False when the caller would have to wait.
+        """
+        with self._lock:
+            try:
+                return self._reserve() <= 0
+            except RuntimeError:  # daily limit reached
+                return False
+
+    def _reserve(self) -> float:
+        """
+        Record a request if the limits allow it now and return 0, otherwise
+        return how long to wait before trying again. Caller holds _lock.
+        """
         current_time = time.time()
         
         # Clean old timestamps
@@ -52,9 +85,7 @@ class RateLimiter:
             oldest_in_minute = self.minute_window[0]
             wait_time = 60 - (current_time - oldest_in_minute)
             if wait_time > 0:
-                print(f"[RateLimiter] Per-minute limit reached. Waiting {wait_time:.2f}s...")
-                time.sleep(wait_time)
-                current_time = time.time()
+                return wait_time
         
         # Check per-day limit
         if len(self.day_window) >= self.config.requests_per_day:
@@ -67,25 +98,27 @@ class RateLimiter:
         if self.last_request_time > 0:
             time_since_last = current_time - self.last_request_time
             if time_since_last < self.config.min_delay_seconds:
-                sleep_time = self.config.min_delay_seconds - time_since_last
-                time.sleep(sleep_time)
-                current_time = time.time()
+                return self.config.min_delay_seconds - time_since_last
         
         # Record this request
         self.minute_window.append(current_time)
         self.day_window.append(current_time)
         self.last_request_time = current_time
+        return 0.0
     
     def get_current_usage(self) -> dict:
         """Get current rate limit usage statistics"""
-        self._clean_old_timestamps(self.minute_window, 60)
-        self._clean_old_timestamps(self.day_window, 86400)
+        with self._lock:
+            self._clean_old_timestamps(self.minute_window, 60)
+            self._clean_old_timestamps(self.day_window, 86400)
+            minute_count = len(self.minute_window)
+            day_count = len(self.day_window)
         
         return {
-            "requests_last_minute": len(self.minute_window),
-            "requests_today": len(self.day_window),
+            "requests_last_minute": minute_count,
+            "requests_today": day_count,
             "minute_limit": self.config.requests_per_minute,
             "day_limit": self.config.requests_per_day,
-            "minute_usage_percent": (len(self.minute_window) / self.config.requests_per_minute) * 100,
-            "day_usage_percent": (len(self.day_window) / self.config.requests_per_day) * 100,
+            "minute_usage_percent": (minute_count / self.config.requests_per_minute) * 100,
+            "day_usage_percent": (day_count / self.config.requests_per_day) * 100,
         }
@@ -0,0 +1,158 @@
+import cProfile
+import functools
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+class Tracer:
+    """
+    Opt-in per-run stage timing.
+
+    Records spans as Chrome trace "complete" events, which open directly in
+    chrome://tracing or https://ui.perfetto.dev. Disabled by default; while
+    disabled, span() and traced() cost a single attribute check.
+    Can optionally run cProfile alongside for a function-level view.
+
+    cProfile only sees the thread that enabled it, so work handed to worker
+    threads is wrapped with profiled(); each wrapped call gets its own
+    profiler and all of them are merged into the dump.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._thread_profilers: List[cProfile.Profile] = []
+
+    def enable(self, profile: bool = False) -> None:
+        """Start recording spans (and cProfile data if profile is True)"""
+        self.events = []
+        self._origin = time.perf_counter()
+        self.enabled = True
+        self._thread_profilers = []
+        if profile:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def disable(self) -> None:
+        self.enabled = False
+        if self._profiler:
+            self._profiler.disable()
+
+    @contextmanager
+    def span(self, name: str, category: str = "app", **args: Any) -> Iterator[None]:
+        """Time the enclosed block as a span called name"""
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            event = {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) * 1e6,
+                "dur": (end - start) * 1e6,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if args:
+                event["args"] = args
+            with self._lock:
+                self.events.append(event)
+
+    def traced(self, name: str, category: str = "app") -> Callable:
+        """Decorator form of span()"""
+        def decorator(func: Callable) -> Callable:
+            @functools.wraps(func)
+            def wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self.span(name, category):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def profiled(self, func: Callable) -> Callable:
+        """
+        Wrap func, which will run on a worker thread, so the call is profiled
+        when profiling is on. Calls on an already profiled thread run as is.
+        """
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not (self.enabled and self._profiler) or sys.getprofile() is not None:
+                return func(*args, **kwargs)
+            profiler = cProfile.Profile()
+            profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                profiler.disable()
+                with self._lock:
+                    self._thread_profilers.append(profiler)
+        return wrapper
+
+    def get_summary(self) -> Dict[str, Dict[str, float]]:
+        """Total time and count per span name, slowest first"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for event in self.events:
+            entry = totals.setdefault(event["name"], {"count": 0, "total_ms": 0.0})
+            entry["count"] += 1
+            entry["total_ms"] += event["dur"] / 1000
+        return dict(sorted(totals.items(), key=lambda item: -item[1]["total_ms"]))
+
+    def print_summary(self) -> None:
+        """Print a formatted per-stage timing table"""
+        print("\n" + "="*50)
+        print("STAGE TIMINGS")
+        print("="*50)
+        for name, entry in self.get_summary().items():
+            print(f"{name:<34} {int(entry['count']):>5} {entry['total_ms']:>9.1f}ms")
+        print("="*50 + "\n")
+
+    def write(self, filename: str | Path) -> None:
+        """Write recorded spans as a Chrome trace / Perfetto JSON file"""
+        path = Path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events = list(self.events)
+        with path.open("w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"[Tracer] Wrote {len(events)} spans to {path}")
+
+    def dump_profile(self, filename: str | Path) -> None:
+        """
+        Write cProfile stats, main thread and worker threads merged
+        (open with pstats or snakeviz)
+        """
+        if not self._profiler:
+            return
+        path = Path(filename)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        stats = pstats.Stats(self._profiler)
+        with self._lock:
+            thread_profilers = list(self._thread_profilers)
+        for profiler in thread_profilers:
+            stats.add(profiler)
+        stats.dump_stats(str(path))
+        print(
+            f"[Tracer] Wrote cProfile stats to {path} "
+            f"(main thread + {len(thread_profilers)} worker calls)"
+        )
+
+
+# Process-wide tracer; enabled by the CLI --trace / --profile flags
+tracer = Tracer()
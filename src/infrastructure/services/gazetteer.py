@@ -0,0 +1,162 @@
+import csv
+import mmap
+import re
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Index file layout (little endian):
+#   header: magic (4s) | version (H) | key size (H) | record count (I)
+#   records, sorted by key: key (KEY_SIZE bytes, NUL padded) | lat (d) | lng (d)
+MAGIC = b"LGGZ"
+VERSION = 1
+KEY_SIZE = 12
+HEADER = struct.Struct("<4sHHI")
+COORDS = struct.Struct("<dd")
+RECORD_SIZE = KEY_SIZE + COORDS.size
+
+# Column names recognised in public postcode CSVs (ONS, ukpostcodes, etc.)
+KEY_COLUMNS = ("postcode", "pcds", "pcd", "outcode", "district", "name")
+LAT_COLUMNS = ("latitude", "lat")
+LNG_COLUMNS = ("longitude", "lng", "long", "lon")
+
+# Country suffixes dropped when normalizing area names such as "LU1, UK"
+COUNTRY_SUFFIXES = {"UK", "GB", "UNITED KINGDOM", "GREAT BRITAIN", "ENGLAND"}
+
+
+def normalize_area(area_name: str) -> str:
+    """
+    Normalize an area name to an index key: "LU1, UK" -> "LU1",
+    "lu1 3ab" -> "LU13AB". Country suffixes and whitespace are dropped.
+    """
+    parts = [part.strip().upper() for part in area_name.split(",")]
+    parts = [part for part in parts if part and part not in COUNTRY_SUFFIXES]
+    return re.sub(r"\s+", "", parts[0]) if parts else ""
+
+
+def _find_column(fieldnames: List[str], candidates: Tuple[str, ...]) -> str:
+    lookup = {name.strip().lower(): name for name in fieldnames}
+    for candidate in candidates:
+        if candidate in lookup:
+            return lookup[candidate]
+    raise ValueError(f"CSV has none of the columns {candidates}; found {fieldnames}")
+
+
+class PostcodeGazetteer:
+    """
+    Offline area name -> (lat, lng) lookup backed by a memory-mapped, sorted
+    index of fixed-size records. Lookups are a binary search over the mapped
+    file, so the index is never loaded into Python objects.
+
+    Build the index once from a public postcode CSV with PostcodeGazetteer.build
+    (or scripts/build_gazetteer.py), then pass the gazetteer to GeocodeService.
+    """
+
+    def __init__(self, index_path: str | Path) -> None:
+        self.index_path = Path(index_path)
+        self._file = self.index_path.open("rb")
+        self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, key_size, count = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION or key_size != KEY_SIZE:
+            self.close()
+            raise ValueError(f"{self.index_path} is not a gazetteer index (version {VERSION})")
+        self.count = count
+        # Area names repeat across runs ("LU1, UK" for every keyword), so
+        # remember results, including misses, by the raw name
+        self._cache: Dict[str, Optional[Tuple[float, float]]] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def close(self) -> None:
+        self._mm.close()
+        self._file.close()
+
+    def lookup(self, area_name: str) -> Optional[Tuple[float, float]]:
+        """Return (lat, lng) for area_name, or None if it is not in the index"""
+        try:
+            return self._cache[area_name]
+        except KeyError:
+            pass
+        location = self._search(area_name)
+        self._cache[area_name] = location
+        return location
+
+    def _search(self, area_name: str) -> Optional[Tuple[float, float]]:
+        key = normalize_area(area_name).encode("ascii", "ignore")
+        if not key or len(key) > KEY_SIZE:
+            return None
+        key = key.ljust(KEY_SIZE, b"\0")
+
+        mm = self._mm
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            offset = HEADER.size + mid * RECORD_SIZE
+            candidate = mm[offset:offset + KEY_SIZE]
+            if candidate < key:
+                lo = mid + 1
+            elif candidate > key:
+                hi = mid
+            else:
+                return COORDS.unpack_from(mm, offset + KEY_SIZE)
+        return None
+
+    @staticmethod
+    def build(
+        csv_path: str | Path,
+        index_path: str | Path,
+        districts: bool = True,
+    ) -> int:
+        """
+        Build an index file from a postcode CSV with postcode/latitude/longitude
+        columns and return the number of keys written.
+
+        With districts=True, full postcodes ("LU1 3AB") are also averaged into
+        district centroids ("LU1"), which is what area searches use.
+        """
+        sums: Dict[bytes, List[float]] = {}
+
+        with Path(csv_path).open("r", encoding="utf-8", newline="") as f:
+            reader = csv.DictReader(f)
+            fieldnames = reader.fieldnames or []
+            key_col = _find_column(fieldnames, KEY_COLUMNS)
+            lat_col = _find_column(fieldnames, LAT_COLUMNS)
+            lng_col = _find_column(fieldnames, LNG_COLUMNS)
+
+            for row in reader:
+                try:
+                    lat = float(row[lat_col])
+                    lng = float(row[lng_col])
+                except (TypeError, ValueError):
+                    continue
+                # ONS files use 99.999999 / 0.0 for postcodes without a location
+                if lat > 90 or (lat == 0 and lng == 0):
+                    continue
+
+                raw_key = (row[key_col] or "").strip().upper()
+                keys = [re.sub(r"\s+", "", raw_key)]
+                if districts and " " in raw_key:
+                    keys.append(raw_key.split()[0])
+
+                for key in keys:
+                    encoded = key.encode("ascii", "ignore")
+                    if not encoded or len(encoded) > KEY_SIZE:
+                        continue
+                    entry = sums.setdefault(encoded, [0.0, 0.0, 0])
+                    entry[0] += lat
+                    entry[1] += lng
+                    entry[2] += 1
+
+        index_path = Path(index_path)
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        with index_path.open("wb") as out:
+            out.write(HEADER.pack(MAGIC, VERSION, KEY_SIZE, len(sums)))
+            for key in sorted(sums):
+                lat_sum, lng_sum, n = sums[key]
+                out.write(key.ljust(KEY_SIZE, b"\0"))
+                out.write(COORDS.pack(lat_sum / n, lng_sum / n))
+
+        print(f"[PostcodeGazetteer] Wrote {len(sums)} areas to {index_path}")
+        return len(sums)
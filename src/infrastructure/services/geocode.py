@@ -1,41 +1,43 @@
 from typing import Tuple, Optional
 
-import requests
+from src.infrastructure.monitoring import RateLimiter, APICostTracker, ApiKeyPool, HedgingPolicy
+from src.infrastructure.services.gazetteer import PostcodeGazetteer
+from src.infrastructure.services.google_api_client import GoogleApiClient
+from src.infrastructure.services.response_decoder import GEOCODE_PROJECTION
 
-from src.infrastructure.config.settings import settings
-from src.infrastructure.monitoring import RateLimiter, APICostTracker
 
-
-class GeocodeService:
+class GeocodeService(GoogleApiClient):
     BASE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+    API_NAME = "geocoding"
+    RESPONSE_PROJECTION = GEOCODE_PROJECTION
 
     def __init__(
         self, 
         api_key: str | None = None,
         rate_limiter: Optional[RateLimiter] = None,
         cost_tracker: Optional[APICostTracker] = None,
+        key_pool: Optional[ApiKeyPool] = None,
+        hedging: Optional[HedgingPolicy] = None,
+        gazetteer: Optional[PostcodeGazetteer] = None,
     ) -> None:
-        self.api_key = api_key or settings.google_maps_api_key
-        self.rate_limiter = rate_limiter
-        self.cost_tracker = cost_tracker
+        super().__init__(api_key, rate_limiter, cost_tracker, key_pool, hedging)
+        self.gazetteer = gazetteer
 
     def geocode_area(self, area_name: str) -> Tuple[float, float]:
         """
-        Convert an area name (e.g. 'Luton, UK') into (lat, lng) using Google Geocoding API.
+        Convert an area name (e.g. 'Luton, UK') into (lat, lng).
+        Checks the offline gazetteer first, if configured, and falls back to
+        the Google Geocoding API on a miss.
         """
-        if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
-        
+        if self.gazetteer:
+            location = self.gazetteer.lookup(area_name)
+            if location:
+                return location
+
         params = {
             "address": area_name,
-            "key": self.api_key,
         }
-        resp = requests.get(self.BASE_URL, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        
-        if self.cost_tracker:
-            self.cost_tracker.track_geocoding()
+        data = self._get(params, APICostTracker.track_geocoding)
 
         status = data.get("status")
         if status != "OK" or not data.get("results"):
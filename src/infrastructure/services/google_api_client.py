@@ -0,0 +1,172 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import requests
+
+from src.infrastructure.config.settings import settings
+from src.infrastructure.services.response_decoder import KEEP, ResponseDecoder
+from src.infrastructure.monitoring import (
+    RateLimiter,
+    APICostTracker,
+    ApiKeyPool,
+    HedgingPolicy,
+    PooledKey,
+    tracer,
+)
+
+
+class GoogleApiClient:
+    """
+    Shared request path for the Google Maps services.
+
+    Handles API key selection (single key or ApiKeyPool), rate limiting,
+    cost tracking and optional request hedging so each service only builds
+    params and reads the response.
+    """
+
+    BASE_URL = ""
+    API_NAME = ""  # Cost tracker name for hedge accounting
+    RESPONSE_PROJECTION: Any = KEEP  # Fields of the JSON response the service reads
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cost_tracker: Optional[APICostTracker] = None,
+        key_pool: Optional[ApiKeyPool] = None,
+        hedging: Optional[HedgingPolicy] = None,
+    ) -> None:
+        self.api_key = api_key or settings.google_maps_api_key
+        self.rate_limiter = rate_limiter
+        self.cost_tracker = cost_tracker
+        self.key_pool = key_pool
+        self.hedging = hedging
+        self.decoder = ResponseDecoder(
+            self.RESPONSE_PROJECTION, settings.record_responses_dir, self.API_NAME
+        )
+
+    def _get(
+        self,
+        params: Dict[str, Any],
+        track: Callable[[APICostTracker], None],
+    ) -> Dict[str, Any]:
+        """
+        GET BASE_URL with params plus an API key and return the decoded JSON.
+
+        track is called with each cost tracker that should record the call.
+        When a key pool is used, a request refused for quota reasons is
+        retried on another key until every key has been tried.
+        """
+        attempts = len(self.key_pool) if self.key_pool else 1
+
+        for _ in range(attempts):
+            pooled = self.key_pool.acquire() if self.key_pool else None
+            self._wait_for_quota(pooled)
+
+            api_key = pooled.api_key if pooled else self.api_key
+            with tracer.span(f"{type(self).__name__}.request", "network"):
+                if self.hedging:
+                    data = self._send_hedged(api_key, params, pooled)
+                else:
+                    data = self._send(api_key, params)
+
+            if self.cost_tracker:
+                track(self.cost_tracker)
+            if pooled:
+                track(pooled.cost_tracker)
+                if not self.key_pool.report_status(pooled, data.get("status")):
+                    continue
+
+            return data
+
+        return data
+
+    def _wait_for_quota(self, pooled: Optional[PooledKey]) -> None:
+        if self.rate_limiter:
+            self.rate_limiter.wait_if_needed()
+        if pooled:
+            pooled.rate_limiter.wait_if_needed()
+
+    def _try_quota(self, pooled: Optional[PooledKey]) -> bool:
+        """Non-blocking _wait_for_quota: False if any limiter has no room now"""
+        if self.rate_limiter and not self.rate_limiter.try_acquire():
+            return False
+        if pooled and not pooled.rate_limiter.try_acquire():
+            return False
+        return True
+
+    def _send(self, api_key: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        with requests.get(
+            self.BASE_URL, params={**params, "key": api_key}, timeout=10, stream=True
+        ) as resp:
+            resp.raise_for_status()
+            return self.decoder.decode(resp)
+
+    def _timed_send(self, api_key: str, params: Dict[str, Any]) -> Tuple[Dict[str, Any], float]:
+        start = time.perf_counter()
+        data = self._send(api_key, params)
+        return data, time.perf_counter() - start
+
+    def _send_hedged(
+        self,
+        api_key: str,
+        params: Dict[str, Any],
+        pooled: Optional[PooledKey],
+    ) -> Dict[str, Any]:
+        """
+        Send the request; if it is still outstanding after the policy's delay,
+        send a duplicate and return whichever response arrives first.
+
+        The slower request cannot be aborted mid-flight with requests; it is
+        cancelled if it has not started and otherwise finishes in the
+        background with its response discarded.
+
+        A hedge is only sent if rate-limit quota and an executor worker are
+        free right now; nothing here waits or raises while the primary is
+        outstanding.
+        """
+        policy = self.hedging
+        policy.record_request()
+        delay = policy.hedge_delay()
+
+        def record_primary_latency(future) -> None:
+            # Recorded even when a hedge wins, so the slow tail stays in the
+            # window that sets the hedge delay
+            if not future.cancelled() and future.exception() is None:
+                policy.record_latency(future.result()[1])
+
+        primary = policy.executor.submit(self._timed_send, api_key, params)
+        primary.add_done_callback(record_primary_latency)
+        pending = {primary}
+
+        if delay is not None:
+            done, _ = wait(pending, timeout=delay)
+            if not done and policy.try_hedge():
+                hedge = None
+                if policy.executor.has_idle_worker() and self._try_quota(pooled):
+                    hedge = policy.executor.try_submit(self._timed_send, api_key, params)
+                if hedge is None:
+                    policy.release_hedge()
+                else:
+                    pending.add(hedge)
+                    if self.cost_tracker:
+                        self.cost_tracker.track_hedge(self.API_NAME)
+                    if pooled:
+                        pooled.cost_tracker.track_hedge(self.API_NAME)
+
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception():
+                    error = error or future.exception()
+                    continue
+                for loser in pending:
+                    loser.cancel()
+                data, _ = future.result()
+                if future is not primary:
+                    policy.record_hedge_win()
+                return data
+
+        raise error
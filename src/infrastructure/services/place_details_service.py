@@ -1,30 +1,29 @@
 import time
 from typing import Any, Dict, Optional
 
-import requests
-
 from src.infrastructure.config.settings import settings
-from src.infrastructure.monitoring import RateLimiter, APICostTracker
+from src.infrastructure.monitoring import RateLimiter, APICostTracker, ApiKeyPool, HedgingPolicy, tracer
+from src.infrastructure.services.google_api_client import GoogleApiClient
+from src.infrastructure.services.response_decoder import PLACE_DETAILS_PROJECTION
 
 
-class PlaceDetailsService:
+class PlaceDetailsService(GoogleApiClient):
     BASE_URL = "https://maps.googleapis.com/maps/api/place/details/json"
+    API_NAME = "place_details"
+    RESPONSE_PROJECTION = PLACE_DETAILS_PROJECTION
 
     def __init__(
         self, 
         api_key: str | None = None,
         rate_limiter: Optional[RateLimiter] = None,
         cost_tracker: Optional[APICostTracker] = None,
+        key_pool: Optional[ApiKeyPool] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ) -> None:
-        self.api_key = api_key or settings.google_maps_api_key
+        super().__init__(api_key, rate_limiter, cost_tracker, key_pool, hedging)
         self.sleep_between_calls = settings.details_sleep_seconds
-        self.rate_limiter = rate_limiter
-        self.cost_tracker = cost_tracker
 
     def get_place_details(self, place_id: str) -> Optional[Dict[str, Any]]:
-        if self.rate_limiter:
-            self.rate_limiter.wait_if_needed()
-        
         fields = [
             "name",
             "formatted_address",
@@ -38,19 +37,14 @@ class PlaceDetailsService:
         params = {
             "place_id": place_id,
             "fields": ",".join(fields),
-            "key": self.api_key,
         }
 
-        resp = requests.get(self.BASE_URL, params=params, timeout=10)
-        resp.raise_for_status()
-        data = resp.json()
-        
-        if self.cost_tracker:
-            self.cost_tracker.track_place_details()
+        data = self._get(params, APICostTracker.track_place_details)
 
         status = data.get("status")
         if status != "OK":
             return None
 
-        time.sleep(self.sleep_between_calls)
+        with tracer.span("PlaceDetailsService.sleep", "sleep"):
+            time.sleep(self.sleep_between_calls)
         return data.get("result") or None
@@ -1,25 +1,27 @@
 import time
 from typing import Any, Dict, List, Optional
 
-import requests
-
 from src.infrastructure.config.settings import settings
-from src.infrastructure.monitoring import RateLimiter, APICostTracker
+from src.infrastructure.monitoring import RateLimiter, APICostTracker, ApiKeyPool, HedgingPolicy, tracer
+from src.infrastructure.services.google_api_client import GoogleApiClient
+from src.infrastructure.services.response_decoder import TEXT_SEARCH_PROJECTION
 
 
-class PlacesSearchService:
+class PlacesSearchService(GoogleApiClient):
     BASE_URL = "https://maps.googleapis.com/maps/api/place/textsearch/json"
+    API_NAME = "places_search"
+    RESPONSE_PROJECTION = TEXT_SEARCH_PROJECTION
 
     def __init__(
         self, 
         api_key: str | None = None,
         rate_limiter: Optional[RateLimiter] = None,
         cost_tracker: Optional[APICostTracker] = None,
+        key_pool: Optional[ApiKeyPool] = None,
+        hedging: Optional[HedgingPolicy] = None,
     ) -> None:
-        self.api_key = api_key or settings.google_maps_api_key
+        super().__init__(api_key, rate_limiter, cost_tracker, key_pool, hedging)
         self.next_page_sleep = settings.next_page_sleep_seconds
-        self.rate_limiter = rate_limiter
-        self.cost_tracker = cost_tracker
 
     def search_places(
         self,
@@ -33,7 +35,6 @@ class PlacesSearchService:
         max_results = max_results or settings.default_max_results
 
         params: Dict[str, Any] = {
-            "key": self.api_key,
             "location": f"{lat},{lng}",
             "radius": radius,
             "query": keyword,
@@ -42,15 +43,7 @@ class PlacesSearchService:
         all_results: List[Dict[str, Any]] = []
 
         while True:
-            if self.rate_limiter:
-                self.rate_limiter.wait_if_needed()
-            
-            resp = requests.get(self.BASE_URL, params=params, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
-            
-            if self.cost_tracker:
-                self.cost_tracker.track_places_search()
+            data = self._get(params, APICostTracker.track_places_search)
 
             status = data.get("status")
             if status not in ("OK", "ZERO_RESULTS"):
@@ -66,7 +59,8 @@ class PlacesSearchService:
             if not next_page_token:
                 break
 
-            time.sleep(self.next_page_sleep)
-            params = {"pagetoken": next_page_token, "key": self.api_key}
+            with tracer.span("PlacesSearchService.next_page_sleep", "sleep"):
+                time.sleep(self.next_page_sleep)
+            params = {"pagetoken": next_page_token}
 
         return all_results[:max_results]
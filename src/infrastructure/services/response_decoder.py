@@ -0,0 +1,173 @@
+import itertools
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the standard library
+    orjson = None
+
+# Projection spec values:
+#   KEEP           keep the value unchanged
+#   PRESENT        replace the value by bool(value) (e.g. "has photos")
+#   {key: spec}    keep only these keys of a dict, projecting each
+#   [spec]         project every item of a list with spec
+KEEP = None
+PRESENT = "present"
+
+INITIAL_BUFFER_SIZE = 64 * 1024
+
+GEOCODE_PROJECTION = {
+    "status": KEEP,
+    "error_message": KEEP,
+    "results": [{"geometry": {"location": KEEP}}],
+}
+
+# Only what LeadCollector and LeadPrioritizer read; photo references,
+# geometry, icons etc. are dropped before results are stored
+TEXT_SEARCH_PROJECTION = {
+    "status": KEEP,
+    "error_message": KEEP,
+    "next_page_token": KEEP,
+    "results": [{
+        "place_id": KEEP,
+        "name": KEEP,
+        "rating": KEEP,
+        "user_ratings_total": KEEP,
+        "business_status": KEEP,
+        "photos": PRESENT,
+    }],
+}
+
+# The request's fields mask already trims the result
+PLACE_DETAILS_PROJECTION = {"status": KEEP, "error_message": KEEP, "result": KEEP}
+
+# Projection for each service's API_NAME; recorded payloads are filed under it
+PROJECTIONS = {
+    "geocoding": GEOCODE_PROJECTION,
+    "places_search": TEXT_SEARCH_PROJECTION,
+    "place_details": PLACE_DETAILS_PROJECTION,
+}
+
+# Shared by every decoder so recorded payloads never overwrite each other;
+# the run id keeps separate runs recording into one directory apart
+_record_counter = itertools.count(1)
+_RECORD_RUN_ID = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+
+
+def loads(data: bytes | bytearray | memoryview) -> Any:
+    """Decode JSON with orjson when installed, else the json module"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def compile_projection(spec: Any) -> Callable[[Any], Any]:
+    """
+    Turn a projection spec into a function that trims a decoded value down
+    to the named fields. Compiled once per service, so no spec is walked per
+    response.
+    """
+    if spec is KEEP:
+        return lambda value: value
+    if spec == PRESENT:
+        return bool
+    if isinstance(spec, dict):
+        keep = tuple(key for key, sub in spec.items() if sub is KEEP)
+        nested = tuple((key, compile_projection(sub)) for key, sub in spec.items() if sub is not KEEP)
+
+        def project_dict(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            out = {key: value[key] for key in keep if key in value}
+            for key, fn in nested:
+                if key in value:
+                    out[key] = fn(value[key])
+            return out
+        return project_dict
+    if isinstance(spec, list):
+        item = compile_projection(spec[0])
+
+        def project_list(value: Any) -> Any:
+            if not isinstance(value, list):
+                return value
+            return [item(v) for v in value]
+        return project_list
+    raise ValueError(f"Invalid projection spec: {spec!r}")
+
+
+class ResponseDecoder:
+    """
+    Reads an HTTP response body into a reusable per-thread buffer, decodes it
+    with the fastest available JSON parser and projects it down to the fields
+    the caller actually uses, so full Google payloads are never kept around.
+    """
+
+    def __init__(
+        self,
+        projection: Any = KEEP,
+        record_dir: str | Path | None = None,
+        name: str = "",
+    ) -> None:
+        """
+        name: API the decoder serves (e.g. "places_search"); recorded payloads
+        go to record_dir/name/ so the benchmark can pick its projection.
+        """
+        self.projection = projection
+        self._project = compile_projection(projection)
+        self.record_dir = Path(record_dir) / name if record_dir else None
+        self._local = threading.local()
+
+    def _buffer(self, size_hint: int) -> bytearray:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or len(buffer) < size_hint:
+            buffer = bytearray(max(size_hint, INITIAL_BUFFER_SIZE))
+            self._local.buffer = buffer
+        return buffer
+
+    def read_body(self, resp: Any) -> memoryview:
+        """
+        Read a streamed requests response into the thread's buffer and return
+        a view of the bytes read. The view is only valid until the next call
+        on the same thread.
+        """
+        length = resp.headers.get("Content-Length")
+        buffer = self._buffer(int(length) if length and length.isdigit() else 0)
+        size = 0
+        raw = resp.raw
+        # requests leaves gzip decoding to iter_content; decode on read instead
+        raw.decode_content = True
+        while True:
+            if size == len(buffer):
+                buffer.extend(bytes(len(buffer)))  # double the buffer in place
+                self._local.buffer = buffer
+            with memoryview(buffer) as view:
+                read = raw.readinto(view[size:])
+            if not read:
+                break
+            size += read
+        return memoryview(buffer)[:size]
+
+    def decode(self, resp: Any) -> Dict[str, Any]:
+        """Decode and project a streamed response"""
+        body = self.read_body(resp)
+        try:
+            if self.record_dir:
+                self._record(body)
+            return self._project(loads(body))
+        finally:
+            body.release()
+
+    def decode_bytes(self, body: bytes | bytearray | memoryview) -> Dict[str, Any]:
+        """Decode and project an already-read payload"""
+        return self._project(loads(body))
+
+    def _record(self, body: memoryview) -> None:
+        self.record_dir.mkdir(parents=True, exist_ok=True)
+        (self.record_dir / f"{_RECORD_RUN_ID}_{next(_record_counter):06d}.json").write_bytes(body)
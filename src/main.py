@@ -1,4 +1,27 @@
+import argparse
+
 from src.cli import run_cli
 
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Collect business leads from Google Maps")
+    parser.add_argument(
+        "--trace",
+        nargs="?",
+        const="auto",
+        help="Record stage timings to a Chrome trace / Perfetto JSON file "
+             "(default: output/traces/run_<timestamp>.json)",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="auto",
+        help="Also dump cProfile stats, including search and hedge worker threads "
+             "(default: output/traces/run_<timestamp>.prof)",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    run_cli()
+    args = parse_args()
+    run_cli(trace_file=args.trace, profile_file=args.profile)
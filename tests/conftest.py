@@ -0,0 +1,4 @@
+import os
+
+# Settings are read at import time and require a key; tests never call the API
+os.environ.setdefault("GOOGLE_MAPS_API_KEY", "test-key")
@@ -0,0 +1,102 @@
+import csv
+
+import pytest
+
+from src.infrastructure.external.csv_merge_state import MergeState
+from src.infrastructure.external.csv_merger import CsvMerger
+
+
+def write_csv(path, rows):
+    with path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "place_id"])
+        writer.writerows(rows)
+    return path
+
+
+def read_ids(path):
+    with path.open("r", newline="", encoding="utf-8") as f:
+        return [row["place_id"] for row in csv.DictReader(f)]
+
+
+@pytest.fixture
+def inputs(tmp_path):
+    return {
+        "lu1": write_csv(tmp_path / "lu1.csv", [("a", "1"), ("b", "2")]),
+        "lu2": write_csv(tmp_path / "lu2.csv", [("b", "2"), ("c", "3")]),
+        "lu3": write_csv(tmp_path / "lu3.csv", [("d", "4")]),
+    }
+
+
+def test_incremental_merge_appends_only_new_rows(tmp_path, inputs):
+    output = tmp_path / "merged.csv"
+    merger = CsvMerger()
+
+    merger.merge_files([inputs["lu1"], inputs["lu2"]], output, incremental=True)
+    stats = merger.merge_files([inputs["lu1"], inputs["lu2"], inputs["lu3"]], output, incremental=True)
+
+    assert stats["files_processed"] == 1
+    assert stats["files_skipped"] == 2
+    assert read_ids(output) == ["1", "2", "3", "4"]
+
+
+def test_output_rewritten_without_incremental_triggers_full_merge(tmp_path, inputs):
+    output = tmp_path / "merged.csv"
+    merger = CsvMerger()
+
+    merger.merge_files([inputs["lu1"], inputs["lu2"]], output, incremental=True)
+    # A plain merge replaces the output and must not leave stale state behind
+    merger.merge_files([inputs["lu2"]], output)
+    assert MergeState.load(output, "place_id") is None
+
+    merger.merge_files([inputs["lu1"], inputs["lu2"], inputs["lu3"]], output, incremental=True)
+
+    assert read_ids(output) == ["1", "2", "3", "4"]
+
+
+def test_output_changed_by_hand_triggers_full_merge(tmp_path, inputs):
+    output = tmp_path / "merged.csv"
+    merger = CsvMerger()
+
+    merger.merge_files([inputs["lu1"], inputs["lu2"]], output, incremental=True)
+    write_csv(output, [("c", "3")])
+
+    merger.merge_files([inputs["lu1"], inputs["lu2"], inputs["lu3"]], output, incremental=True)
+
+    assert read_ids(output) == ["1", "2", "3", "4"]
+
+
+@pytest.mark.parametrize("crash_in", ["append_ids", "commit"])
+def test_interrupted_incremental_merge_is_rolled_back(tmp_path, inputs, monkeypatch, crash_in):
+    output = tmp_path / "merged.csv"
+    merger = CsvMerger()
+    merger.merge_files([inputs["lu1"]], output, incremental=True)
+
+    calls = {"commit": 0}
+    original_commit = MergeState.commit
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    def crash_on_first_commit(self):
+        calls["commit"] += 1
+        if calls["commit"] == 1:
+            raise KeyboardInterrupt
+        original_commit(self)
+
+    with monkeypatch.context() as m:
+        if crash_in == "append_ids":
+            m.setattr(MergeState, "append_ids", crash)
+        else:
+            m.setattr(MergeState, "commit", crash_on_first_commit)
+        with pytest.raises(KeyboardInterrupt):
+            merger.merge_files([inputs["lu1"], inputs["lu2"]], output, incremental=True)
+
+    # Rows were appended but not committed
+    assert read_ids(output) == ["1", "2", "3"]
+
+    stats = merger.merge_files([inputs["lu1"], inputs["lu2"]], output, incremental=True)
+
+    assert stats["files_processed"] == 1
+    assert read_ids(output) == ["1", "2", "3"]
+    assert MergeState.load(output, "place_id").load_ids() == {"1", "2", "3"}
@@ -0,0 +1,66 @@
+import gzip
+
+import pytest
+
+from src.domain.models import BusinessLead
+from src.infrastructure.external.exporters import get_exporter
+
+GZIP_MAGIC = b"\x1f\x8b"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+ZIP_MAGIC = b"PK\x03\x04"  # .xlsx is a zip archive
+
+
+def make_leads():
+    return [
+        BusinessLead(
+            name="Cuts Studio",
+            address="1 High Street, Luton LU1 1AB, UK",
+            phone="01582 123456",
+            website="https://www.cutsstudio.co.uk/",
+            google_maps_url="https://maps.google.com/?cid=1",
+            rating=5,
+            user_ratings_total=12,
+            place_id="ChIJ1",
+            keywords=["barber"],
+        )
+    ]
+
+
+@pytest.mark.parametrize(
+    "extension, magic",
+    [
+        (".csv", b"name,"),
+        (".csv.gz", GZIP_MAGIC),
+        (".CSV.GZ", GZIP_MAGIC),
+        (".csv.zst", ZSTD_MAGIC),
+        (".CSV.ZST", ZSTD_MAGIC),
+        (".xlsx", ZIP_MAGIC),
+        (".XLSX", ZIP_MAGIC),
+    ],
+)
+def test_export_writes_the_format_of_the_extension(tmp_path, extension, magic):
+    if extension.lower().endswith(".zst"):
+        pytest.importorskip("zstandard")
+    if extension.lower() == ".xlsx":
+        pytest.importorskip("openpyxl")
+    path = tmp_path / f"leads{extension}"
+
+    get_exporter(path).export(path, make_leads())
+
+    assert path.read_bytes().startswith(magic)
+
+
+def test_gzip_export_round_trips(tmp_path):
+    path = tmp_path / "leads.csv.gz"
+
+    get_exporter(path).export(path, make_leads())
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert lines[0].startswith("name,address")
+    assert "ChIJ1" in lines[1]
+
+
+def test_unknown_extension_is_rejected():
+    with pytest.raises(ValueError):
+        get_exporter("leads.txt")
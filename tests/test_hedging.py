@@ -0,0 +1,164 @@
+import threading
+import time
+
+import pytest
+import requests
+
+from src.application.lead_prioritizer import CollectionBudget
+from src.infrastructure.monitoring import (
+    APICostTracker,
+    HedgeExecutor,
+    HedgingConfig,
+    HedgingPolicy,
+    RateLimitConfig,
+    RateLimiter,
+)
+from src.infrastructure.services.google_api_client import GoogleApiClient
+
+
+class FakeClient(GoogleApiClient):
+    """Replaces the HTTP call with scripted responses, one per request sent"""
+
+    API_NAME = "place_details"
+
+    def __init__(self, responses, **kwargs):
+        super().__init__(api_key="test-key", **kwargs)
+        self.responses = list(responses)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def _send(self, api_key, params):
+        with self._lock:
+            response = self.responses[self.calls]
+            self.calls += 1
+        return response()
+
+
+def slow(data, release):
+    def respond():
+        release.wait(timeout=5)
+        return data
+    return respond
+
+
+def fast(data):
+    return lambda: data
+
+
+def fail():
+    raise requests.HTTPError("500 Server Error")
+
+
+def warmed_policy(executor, latency=0.01):
+    policy = HedgingPolicy(
+        HedgingConfig(min_samples=5, min_delay_seconds=0.05, max_hedge_ratio=1.0),
+        executor=executor,
+    )
+    for _ in range(5):
+        policy.requests += 1
+        policy.record_latency(latency)
+    return policy
+
+
+@pytest.fixture
+def executor():
+    executor = HedgeExecutor(max_workers=4)
+    yield executor
+    executor.shutdown()
+
+
+def test_hedge_fires_and_wins(executor):
+    release = threading.Event()
+    policy = warmed_policy(executor)
+    tracker = APICostTracker()
+    client = FakeClient(
+        [slow({"status": "OK", "from": "primary"}, release), fast({"status": "OK", "from": "hedge"})],
+        cost_tracker=tracker,
+        hedging=policy,
+    )
+
+    start = time.perf_counter()
+    data = client._get({}, APICostTracker.track_place_details)
+    elapsed = time.perf_counter() - start
+    release.set()
+
+    assert data["from"] == "hedge"
+    assert elapsed < 1
+    assert policy.hedges == 1
+    assert policy.hedge_wins == 1
+    assert tracker.get_summary()["hedged_calls"] == 1
+
+
+def test_slow_primary_latency_is_recorded_when_hedge_wins(executor):
+    release = threading.Event()
+    policy = warmed_policy(executor)
+    client = FakeClient(
+        [slow({"status": "OK"}, release), fast({"status": "OK"})],
+        hedging=policy,
+    )
+
+    client._get({}, APICostTracker.track_place_details)
+    time.sleep(0.3)
+    release.set()
+    deadline = time.monotonic() + 5
+    while len(policy.latencies) < 6 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # Only the primary's (slow) latency is added, not the hedge's
+    assert len(policy.latencies) == 6
+    assert policy.latencies[-1] >= 0.3
+
+
+def test_no_idle_worker_means_no_hedge():
+    executor = HedgeExecutor(max_workers=1)
+    policy = warmed_policy(executor)
+    client = FakeClient(
+        [lambda: time.sleep(0.2) or {"status": "OK", "from": "primary"}],
+        hedging=policy,
+    )
+    try:
+        data = client._get({}, APICostTracker.track_place_details)
+    finally:
+        executor.shutdown()
+
+    assert data["from"] == "primary"
+    assert client.calls == 1
+    assert policy.hedges == 0
+
+
+def test_no_quota_means_no_hedge_and_no_wait(executor):
+    limiter = RateLimiter(RateLimitConfig(requests_per_minute=1, min_delay_seconds=0))
+    policy = warmed_policy(executor)
+    client = FakeClient(
+        [lambda: time.sleep(0.2) or {"status": "OK", "from": "primary"}],
+        rate_limiter=limiter,
+        hedging=policy,
+    )
+
+    start = time.perf_counter()
+    data = client._get({}, APICostTracker.track_place_details)
+
+    assert data["from"] == "primary"
+    assert time.perf_counter() - start < 1
+    assert policy.hedges == 0
+
+
+def test_primary_error_without_hedge_raises(executor):
+    policy = HedgingPolicy(HedgingConfig(), executor=executor)  # no samples: never hedges
+    client = FakeClient([fail], hedging=policy)
+
+    with pytest.raises(requests.HTTPError):
+        client._get({}, APICostTracker.track_place_details)
+    assert policy.hedges == 0
+
+
+def test_budget_counts_hedged_details_calls():
+    budget = CollectionBudget(max_cost_usd=0.06)
+    budget.record_details_call()
+    budget.record_details_call()
+    assert not budget.exhausted()
+
+    budget.record_hedged_details_calls(1)
+
+    assert budget.spent_usd == pytest.approx(3 * 17.0 / 1000)
+    assert budget.exhausted()
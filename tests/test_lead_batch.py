@@ -0,0 +1,52 @@
+from src.domain.lead_batch import LeadBatch
+from src.domain.models import BusinessLead
+from src.infrastructure.external.csv_exporter import CsvExporter
+
+
+def make_lead(place_id, rating, **overrides):
+    fields = dict(
+        name=f"Studio {place_id}",
+        address=f"{place_id} High Street, Luton LU1 1AB, UK",
+        phone="01582 123456",
+        website=f"https://www.studio{place_id}.co.uk/",
+        google_maps_url=f"https://maps.google.com/?cid={place_id}",
+        rating=rating,
+        user_ratings_total=10,
+        place_id=f"ChIJ{place_id}",
+        keywords=["barber"],
+    )
+    fields.update(overrides)
+    return BusinessLead(**fields)
+
+
+def make_leads():
+    return [
+        make_lead("1", 5),
+        make_lead("2", 4.5),
+        make_lead("3", None, user_ratings_total=None, website=None, phone=None),
+    ]
+
+
+def test_round_trip_keeps_rating_types():
+    leads = make_leads()
+
+    restored = LeadBatch.from_leads(leads).to_leads()
+
+    assert restored == leads
+    assert [type(lead.rating) for lead in restored] == [int, float, type(None)]
+
+
+def test_take_keeps_rating_types():
+    batch = LeadBatch.from_leads(make_leads()).take([1, 0])
+
+    assert [lead.rating for lead in batch] == [4.5, 5]
+    assert type(batch[1].rating) is int
+
+
+def test_batch_exports_same_csv_as_list(tmp_path):
+    leads = make_leads()
+
+    CsvExporter().export(tmp_path / "list.csv", leads)
+    CsvExporter().export(tmp_path / "batch.csv", LeadBatch.from_leads(leads))
+
+    assert (tmp_path / "batch.csv").read_bytes() == (tmp_path / "list.csv").read_bytes()